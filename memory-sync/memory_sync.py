@@ -23,20 +23,35 @@ import os
 import re
 import json
 import time
+import heapq
 from pathlib import Path
 from datetime import datetime, date, timezone, timedelta
 from zoneinfo import ZoneInfo
-from dataclasses import dataclass, field
-from typing import Iterator, Optional, Tuple, List, Literal
-from collections import defaultdict
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, Iterator, Optional, Tuple, List, Literal
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
 from enum import Enum
-import tempfile
 
 import click
 
+# Optional: orjson for faster JSON encoding/decoding; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decoder for session log lines; both accept the raw bytes parse_jsonl reads
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Optional: anthropic for LLM summarization (only imported if needed)
 # Will gracefully handle ImportError in summarization functions
 
+# concurrent.futures and hashlib are imported inside the code paths that use
+# them (backfill workers, the LLM cache), so `--help`, `compare`, `stats` etc.
+# don't pay for them.
+
 
 # =============================================================================
 # CONFIGURATION CONSTANTS
@@ -45,6 +60,7 @@ import click
 # Default paths for OpenClaw
 DEFAULT_SESSIONS_DIR = Path.home() / '.openclaw' / 'agents' / 'main' / 'sessions'
 DEFAULT_MEMORY_DIR = Path.home() / '.openclaw' / 'workspace' / 'memory'
+DEFAULT_LLM_CACHE_DIR = Path.home() / '.openclaw' / 'workspace' / '.llmcache'
 
 # Local timezone for bucketing "days" (Mike/Wren live in PST/PDT)
 LOCAL_TZ = ZoneInfo("America/Los_Angeles")
@@ -53,25 +69,73 @@ LOCAL_TZ = ZoneInfo("America/Los_Angeles")
 MIN_FILE_SIZE_BYTES = 1024
 MIN_BYTES_PER_MESSAGE = 3  # Heuristic floor; high tool-result volume can depress bytes/msg even with good summaries
 
+# Date-filtered reads binary-search files at least this large for their start offset
+DATE_SEEK_MIN_BYTES = 256 * 1024
+DATE_SEEK_WINDOW_BYTES = 64 * 1024  # stop bisecting once the candidate range is this small
+
+# Manifests caching each log's first/last record and message dates, one per sessions dir
+# (see get_session_index_path); kept in the workspace, not OpenClaw's log dir
+SESSION_INDEX_DIR = Path.home() / '.openclaw' / 'workspace' / '.sessionindex'
+SESSION_INDEX_VERSION = 1
+
+# Manifests caching each log's per-day activity (counts, models, transitions;
+# never message text), one per sessions dir (see get_session_activity_path)
+SESSION_CACHE_DIR = Path.home() / '.cache' / 'memory-sync'
+SESSION_ACTIVITY_VERSION = 1
+
+# find_session_files only memoizes directories whose mtime is at least this old,
+# so a change hidden by coarse (1-2s) filesystem timestamps is never cached
+SESSION_LIST_CACHE_MIN_AGE_SECONDS = 2.0
+
 # Markers for identifying auto-generated content
-AUTO_GENERATED_HEADER_PATTERN = r'\*Auto-generated from \d+ session messages\*'
+AUTO_GENERATED_HEADER_RE = re.compile(r'\*Auto-generated from (\d+) session messages\*')
 AUTO_GENERATED_FOOTER = '*Review and edit this draft to capture what\'s actually important.*'
 
 # Validation thresholds
 MIN_VALID_SIZE = 100  # bytes - minimum size for a memory file to be considered non-empty
 
+# Write buffer for memory files; large enough that a typical daily file is one write syscall
+MEMORY_WRITE_BUFFER_SIZE = 65536
+
+# Read buffer for streaming session logs; fewer read() calls than the 8 KiB default
+JSONL_READ_BUFFER_SIZE = 1024 * 1024
+
 # Default LLM model for summarization
 DEFAULT_SUMMARIZE_MODEL = "claude-sonnet-4-20250514"
 
+# Part of the rendered-memory cache key (see render_summarized_memory); bump when
+# the summarization prompt template or the memory file layout changes
+RENDER_CACHE_VERSION = 1
+
 # Rate limiting for batch LLM calls (seconds between requests)
 LLM_BATCH_DELAY_SECONDS = 1.0
 
+# Status polling interval for `backfill --all --summarize --batch` (Anthropic Message Batches)
+ANTHROPIC_BATCH_POLL_SECONDS = 30.0
+# Consecutive failed status/results requests tolerated before giving up on a batch
+ANTHROPIC_BATCH_MAX_POLL_ERRORS = 10
+
+# Concurrent LLM calls for multi-day `backfill --summarize` (override with MEMORY_SYNC_CONCURRENCY)
+DEFAULT_LLM_CONCURRENCY = 4
+
+# CLI output is buffered and written in chunks of about this many characters
+OUTPUT_FLUSH_CHARS = 65536
+
+# Whole-directory scans (extract, stats, compare, backfill --all) parse session
+# files in a process pool once they total at least this many bytes
+PARALLEL_PARSE_MIN_BYTES = 16 * 1024 * 1024
+
+# sanitize_content memoizes results for texts up to this many characters
+# (bounds the cache to roughly SANITIZE_CACHE_SIZE * 2 * SANITIZE_CACHE_MAX_CHARS)
+SANITIZE_CACHE_SIZE = 4096
+SANITIZE_CACHE_MAX_CHARS = 16 * 1024
+
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a parsed message from a JSONL session log."""
     id: str
@@ -84,7 +148,7 @@ class Message:
     has_thinking: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelTransition:
     """Represents a model switch detected in session logs."""
     timestamp: datetime
@@ -95,7 +159,40 @@ class ModelTransition:
     from_provider: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class SessionScan:
+    """Messages, transitions and compactions collected in one pass over a session log."""
+    session_id: str
+    messages: list[Message] = field(default_factory=list)
+    transitions: list[ModelTransition] = field(default_factory=list)
+    compactions: list[dict] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DayRecords:
+    """Messages, transitions and compaction summary for a single local date."""
+    messages: list[Message] = field(default_factory=list)
+    transitions: list[ModelTransition] = field(default_factory=list)
+    compaction_summary: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SessionFileMeta:
+    """A session log path with the stat fields captured when it was listed."""
+    path: Path
+    size: int
+    mtime: float
+
+
+@dataclass(slots=True)
+class MemoryFileMeta:
+    """A daily memory file with its date and the size captured when it was listed."""
+    date: date
+    path: Path
+    size: int
+
+
+@dataclass(slots=True)
 class DayActivity:
     """Summary of activity for a single day across all sessions."""
     date: date
@@ -108,7 +205,7 @@ class DayActivity:
     session_ids: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryGap:
     """Represents a gap in memory coverage."""
     date: date
@@ -118,7 +215,7 @@ class MemoryGap:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a validation issue with a memory file."""
     file_path: str
@@ -127,7 +224,7 @@ class ValidationIssue:
     severity: Literal["warning", "error"] = "warning"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Statistics about session logs."""
     file_count: int
@@ -141,7 +238,7 @@ class SessionStats:
     date_range: tuple[Optional[date], Optional[date]] = (None, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryStats:
     """Statistics about memory files."""
     file_count: int
@@ -211,7 +308,9 @@ SECRET_PATTERNS = [
     (r'-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----', 'SSH-PRIVATE-KEY'),
     (r'ssh-(?:rsa|dss|ed25519|ecdsa)\s+[A-Za-z0-9+/]{30,}={0,3}', 'SSH-PUBLIC-KEY'),
     (r'(?:postgresql|mysql|mongodb|redis)://[^:@\s]+:[^@\s]+@[^\s]+', 'CONNECTION-STRING'),
-    (r'\w+://[^:]+:[^@]+@\S+', 'CONNECTION-STRING'),
+    # Anchored at a word start with a possessive \w++ (same matches as \w+://):
+    # otherwise every offset of a long word run rescans it to the end
+    (r'\b\w++://[^:\s]+:[^@\s]+@\S+', 'CONNECTION-STRING'),
     (r'\b[0-9a-f]{64}\b', 'HEX-TOKEN-64'),
     # HEX-32 removed: (r'\b[0-9a-f]{32}\b', 'HEX-TOKEN-32') - matches git hashes
     (r'\b[A-Za-z0-9+/]{40,}={0,2}\b', 'BASE64'),
@@ -220,13 +319,18 @@ SECRET_PATTERNS = [
     # GENERIC PATTERNS (Catch-all)
     # ==========================================================================
     
-    (r'(?i)(\w*api\w*[_-]?\w*key\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'API-KEY'),
-    (r'(?i)(\w*secret\w*[_-]?\w*key\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'SECRET'),
-    (r'(?i)(\w*access\w*[_-]?\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'ACCESS-TOKEN'),
-    (r'(?i)(\w*auth\w*[_-]?\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'AUTH-TOKEN'),
-    (r'(?i)(\w*api\w*[_-]?\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'API-TOKEN'),
+    # Generic key=value patterns. The \b(?=[\w-]*+\s*[=:]) guard is implied by
+    # the rest of each pattern (a match starts a word and the word ends at
+    # \s*[=:]), but it rejects a start in one possessive scan; without it long
+    # word runs (base64 blobs) containing e.g. 'api' and 'key' backtrack
+    # quadratically.
+    (r'(?i)\b(?=[\w-]*+\s*[=:])(\w*api\w*[_-]?\w*key\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'API-KEY'),
+    (r'(?i)\b(?=[\w-]*+\s*[=:])(\w*secret\w*[_-]?\w*key\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'SECRET'),
+    (r'(?i)\b(?=[\w-]*+\s*[=:])(\w*access\w*[_-]?\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'ACCESS-TOKEN'),
+    (r'(?i)\b(?=[\w-]*+\s*[=:])(\w*auth\w*[_-]?\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'AUTH-TOKEN'),
+    (r'(?i)\b(?=[\w-]*+\s*[=:])(\w*api\w*[_-]?\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'API-TOKEN'),
     (r'(?i)(bearer\s+)(?!\[REDACTED)([^\s"\'\n\[]{16,})', 'BEARER-TOKEN'),
-    (r'(?i)(\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'TOKEN'),
+    (r'(?i)\b(?=[\w-]*+\s*[=:])(\w*token\w*)\s*[=:]\s*["\']?(?!\[REDACTED)([^\s"\'\n\[]{16,})["\']?', 'TOKEN'),
     (r'(?i)(password|passwd|pwd)\s*[=:]\s*["\']?([^\s"\'\n]{8,})["\']?', 'PASSWORD'),
     (r'(?i)(private[_-]?key|privkey)\s*[=:]\s*["\']?([^\s"\'\n]{20,})["\']?', 'PRIVATE-KEY'),
     (r'\$[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD|CREDENTIAL)[A-Z_]*\b', 'ENV-VAR'),
@@ -255,6 +359,63 @@ SENSITIVE_ENV_VAR_NAMES = [
 ]
 
 
+# Leading run of literal characters, up to the first metacharacter or escape
+_LITERAL_PREFIX_RE = re.compile(r'[^\\\[\](){}.?*+|^$]*')
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the literal text every match of a (top-level) pattern starts with."""
+    literal = _LITERAL_PREFIX_RE.match(pattern).group()
+    if literal and pattern[len(literal):len(literal) + 1] in ('?', '*', '{'):
+        literal = literal[:-1]  # a quantifier makes the last character optional
+    return literal
+
+
+def _required_markers(pattern: str) -> tuple[str, ...]:
+    """Return literals of which every match of ``pattern`` contains at least one.
+    
+    That is '://' for URL patterns, the literal prefix of the pattern, or the
+    prefixes of the alternatives in a leading group like (password|passwd|pwd).
+    An empty tuple means no marker could be derived and the pattern always runs.
+    """
+    if '://' in pattern:
+        return ('://',)
+    body = pattern.removeprefix('(?i)')
+    # A top-level | would make a prefix optional
+    depth = 0
+    for ch in re.sub(r'\\.|\[(?:\\.|[^\]])*\]', '', body):
+        depth += (ch == '(') - (ch == ')')
+        if ch == '|' and depth == 0:
+            return ()
+    group = re.match(r'\(([^()?][^()]*)\)(?![?*{])', body)
+    alternatives = group.group(1).split('|') if group else [body]
+    markers = tuple(_literal_prefix(alternative) for alternative in alternatives)
+    if not all(markers):
+        return ()
+    if pattern.startswith('(?i)'):
+        markers = tuple(marker.casefold() for marker in markers)
+    return markers
+
+
+def _ascii_locator(pattern: str) -> Optional[re.Pattern]:
+    """Case-sensitive twin of a (?i) pattern, to search lowercased ASCII text.
+
+    On ASCII text, wherever the (?i) pattern matches, the twin matches the
+    lowercased text; without IGNORECASE the engine can jump between
+    occurrences of the literal prefix, so a miss rules the pattern out cheaply.
+    None unless the pattern has markers (a literal prefix) and no uppercase
+    letters outside escapes and negative lookaheads (which, never matching
+    lowercased text, only make the twin match more).
+    """
+    if not pattern.startswith('(?i)') or not _required_markers(pattern):
+        return None
+    body = pattern.removeprefix('(?i)')
+    positive = re.sub(r'\(\?!(?:\\.|[^()])*\)', '', re.sub(r'\\.', '_', body))
+    if re.search(r'[A-Z]', positive):
+        return None
+    return re.compile(body)
+
+
 class ContentSensitivity(Enum):
     """Content sensitivity level for classification."""
     SAFE = "safe"
@@ -262,34 +423,33 @@ class ContentSensitivity(Enum):
     SECRET = "secret"
 
 
+# classify_content patterns, compiled once at import time
+_DEFINITE_SECRET_RES = [re.compile(p) for p in (
+    r'sk-(?:proj-|ant-)?[a-zA-Z0-9\-_]{30,}',
+    r'AKIA[A-Z0-9]{16}',
+    r'-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----',
+    r'eyJ[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}',
+    r'gh[pousr]_[A-Za-z0-9]{20,}',
+)]
+
+# The sensitive keywords share one pass; \b(?:a|b)\b is \ba\b|\bb\b
+_SENSITIVE_RE = re.compile(
+    r'\$[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)'
+    r'|\b(?:api[_-]?key|password|token|secret)\b',
+    re.IGNORECASE,
+)
+# Every _SENSITIVE_RE match contains one of these (case-folded)
+_SENSITIVE_MARKERS = ('$', 'api', 'password', 'token', 'secret')
+
+
 def classify_content(content: str) -> ContentSensitivity:
     """Classify content sensitivity level based on pattern matching."""
-    definite_secret_patterns = [
-        r'sk-(?:proj-|ant-)?[a-zA-Z0-9\-_]{30,}',
-        r'AKIA[A-Z0-9]{16}',
-        r'-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----',
-        r'eyJ[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}',
-        r'gh[pousr]_[A-Za-z0-9]{20,}',
-    ]
-    
-    for pattern in definite_secret_patterns:
-        if re.search(pattern, content):
+    for regex in _DEFINITE_SECRET_RES:
+        if regex.search(content):
             return ContentSensitivity.SECRET
     
-    sensitive_patterns = [
-        r'\$[A-Z_]*(?:KEY|SECRET|TOKEN|PASSWORD)',
-        r'(?i)\bapi[_-]?key\b',
-        r'(?i)\bpassword\b',
-        r'(?i)\btoken\b',
-        r'(?i)\bsecret\b',
-    ]
-    
-    sensitive_count = sum(
-        1 for pattern in sensitive_patterns
-        if re.search(pattern, content, re.IGNORECASE)
-    )
-    
-    if sensitive_count > 0:
+    folded = content.casefold().replace('ı', 'i')
+    if any(marker in folded for marker in _SENSITIVE_MARKERS) and _SENSITIVE_RE.search(content):
         return ContentSensitivity.SENSITIVE
     
     return ContentSensitivity.SAFE
@@ -312,27 +472,102 @@ def _make_context_replacer(pattern: str, redaction_type: str):
     return replace_with_context
 
 
+def _compile_secret_substitutions() -> list[tuple[re.Pattern, object, tuple[str, ...], tuple[str, ...], Optional[re.Pattern]]]:
+    """Compile SECRET_PATTERNS into (regex, replacement, keywords, markers, locator).
+    
+    Patterns that capture a key name keep it (key=[REDACTED-TYPE]) via
+    _make_context_replacer; the rest are replaced outright. Required keywords
+    are the literal words a generic pattern needs (e.g. 'api' and 'key' for
+    API-KEY); if any is absent from the text the regex cannot match. Markers
+    (see _required_markers) gate the remaining patterns: if none occurs the
+    regex cannot match either. A locator (see _ascii_locator) then rules out
+    case-insensitive patterns on ASCII text.
+    """
+    substitutions = []
+    for pattern, redaction_type in SECRET_PATTERNS:
+        if '(' in pattern and ')' in pattern and any(
+            kw in pattern for kw in ['api', 'secret', 'password', 'token', 'bearer']
+        ):
+            replacement = _make_context_replacer(pattern, redaction_type)
+        else:
+            replacement = f"[REDACTED-{redaction_type}]"
+        keywords = tuple(re.findall(r'\\w\*([a-z]+)\\w\*', pattern))
+        substitutions.append((
+            re.compile(pattern), replacement, keywords,
+            _required_markers(pattern), _ascii_locator(pattern),
+        ))
+    return substitutions
+
+
+# Compiled once at import time: sanitize_content runs once per message
+_SECRET_SUBSTITUTIONS = _compile_secret_substitutions()
+
+
 def sanitize_content(content: str) -> str:
     """Remove all potentially sensitive content before processing.
     
     Replaces detected secrets with [REDACTED-TYPE] placeholders.
     This function is idempotent.
     """
+    # Session logs repeat text (heartbeats, replayed prompts, identical tool
+    # output), so results are memoized; large texts are not worth pinning
+    if len(content) <= SANITIZE_CACHE_MAX_CHARS:
+        return _sanitize_content_cached(content)
+    return _sanitize_content(content)
+
+
+def _sanitize_content(content: str) -> str:
+    """Apply SECRET_PATTERNS to content (uncached sanitize_content)."""
     sanitized = content
+    # Case-folded copy for keyword checks; (?i) also matches dotless i to 'i'
+    folded = content.casefold().replace('ı', 'i')
     
-    for pattern, redaction_type in SECRET_PATTERNS:
-        if '(' in pattern and ')' in pattern:
-            if any(kw in pattern for kw in ['api', 'secret', 'password', 'token', 'bearer']):
-                replacer = _make_context_replacer(pattern, redaction_type)
-                sanitized = re.sub(pattern, replacer, sanitized)
-            else:
-                sanitized = re.sub(pattern, f"[REDACTED-{redaction_type}]", sanitized)
-        else:
-            sanitized = re.sub(pattern, f"[REDACTED-{redaction_type}]", sanitized)
+    for regex, replacement, keywords, markers, locator in _SECRET_SUBSTITUTIONS:
+        # Substring checks are far cheaper than a regex scan; skip patterns
+        # whose keywords or markers do not occur at all
+        if keywords and not all(kw in folded for kw in keywords):
+            continue
+        if markers:
+            text = folded if regex.flags & re.IGNORECASE else sanitized
+            if not any(marker in text for marker in markers):
+                continue
+        # For ASCII text, folded is exactly sanitized.lower()
+        if locator is not None and sanitized.isascii() and not locator.search(folded):
+            continue
+        result = regex.sub(replacement, sanitized)
+        if result != sanitized:
+            sanitized = result
+            folded = sanitized.casefold().replace('ı', 'i')
     
     return sanitized
 
 
+_sanitize_content_cached = lru_cache(maxsize=SANITIZE_CACHE_SIZE)(_sanitize_content)
+
+
+# validate_no_secrets checks: (regex, violation, whether matches containing
+# 'REDACTED' are allowed, markers, locator). Each check stops at its first
+# offending match and is skipped when none of its markers occurs or, on ASCII
+# text, its locator finds nothing.
+_VALIDATION_CHECKS = [
+    (re.compile(p), message, skip_redacted, _required_markers(p), _ascii_locator(p))
+    for p, message, skip_redacted in (
+        (r'sk-(?:proj-)?[a-zA-Z0-9]{30,}', "Found potential OpenAI API key (sk-...)", False),
+        (r'sk-ant-[a-zA-Z0-9\-_]{32,}', "Found potential Anthropic API key (sk-ant-...)", False),
+        (r'ak-[a-zA-Z0-9]{20,}', "Found potential Composio API key (ak-...)", False),
+        (r'gh[pousr]_[A-Za-z0-9]{20,}', "Found potential GitHub token (gh*_...)", False),
+        (r'AKIA[A-Z0-9]{16}', "Found potential AWS access key (AKIA...)", False),
+        (r'ASIA[A-Z0-9]{16}', "Found potential AWS session key (ASIA...)", False),
+        (r'\b[A-Za-z0-9+/]{40,}={0,2}\b', "Found unredacted high-entropy base64 string", True),
+        # The value class excludes '[', so a match is never a [REDACTED value
+        (r'(?i)password\s*[=:]\s*["\']?([^\s"\'\[]+)', "Found unredacted password assignment", False),
+        (r'eyJ[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}', "Found potential JWT token", False),
+        (r'-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----', "Found SSH private key header", False),
+        (r'\b\w++://[^:@\s]+:[^@\s]+@\S+', "Found connection string with embedded credentials", True),
+    )
+]
+
+
 def validate_no_secrets(content: str) -> Tuple[bool, List[str]]:
     """Validate that content contains no unredacted secrets.
     
@@ -340,49 +575,24 @@ def validate_no_secrets(content: str) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_violations)
     """
     violations = []
+    folded = content.casefold().replace('ı', 'i')
     
-    if re.search(r'sk-(?:proj-)?[a-zA-Z0-9]{30,}', content):
-        violations.append("Found potential OpenAI API key (sk-...)")
-    
-    if re.search(r'sk-ant-[a-zA-Z0-9\-_]{32,}', content):
-        violations.append("Found potential Anthropic API key (sk-ant-...)")
-    
-    if re.search(r'ak-[a-zA-Z0-9]{20,}', content):
-        violations.append("Found potential Composio API key (ak-...)")
-    
-    if re.search(r'gh[pousr]_[A-Za-z0-9]{20,}', content):
-        violations.append("Found potential GitHub token (gh*_...)")
-    
-    if re.search(r'AKIA[A-Z0-9]{16}', content):
-        violations.append("Found potential AWS access key (AKIA...)")
-    
-    if re.search(r'ASIA[A-Z0-9]{16}', content):
-        violations.append("Found potential AWS session key (ASIA...)")
-    
-    base64_matches = re.findall(r'\b[A-Za-z0-9+/]{40,}={0,2}\b', content)
-    for match in base64_matches:
-        if 'REDACTED' not in match:
-            violations.append(f"Found unredacted high-entropy base64 string")
-            break
-    
-    password_pattern = r'(?i)password\s*[=:]\s*["\']?([^\s"\'\[]+)'
-    for match in re.finditer(password_pattern, content):
-        value = match.group(1)
-        if not value.startswith('[REDACTED'):
-            violations.append("Found unredacted password assignment")
-            break
-    
-    if re.search(r'eyJ[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}', content):
-        violations.append("Found potential JWT token")
-    
-    if re.search(r'-----BEGIN (?:RSA |DSA |EC |OPENSSH )?PRIVATE KEY-----', content):
-        violations.append("Found SSH private key header")
+    is_ascii = content.isascii()
     
-    if re.search(r'\w+://[^:@\s]+:[^@\s]+@', content):
-        conn_matches = re.findall(r'\w+://[^:@\s]+:[^@\s]+@\S+', content)
-        for match in conn_matches:
-            if 'REDACTED' not in match:
-                violations.append("Found connection string with embedded credentials")
+    for regex, message, skip_redacted, markers, locator in _VALIDATION_CHECKS:
+        if markers:
+            text = folded if regex.flags & re.IGNORECASE else content
+            if not any(marker in text for marker in markers):
+                continue
+        if locator is not None and is_ascii and not locator.search(folded):
+            continue
+        if not skip_redacted:
+            if regex.search(content):
+                violations.append(message)
+            continue
+        for match in regex.finditer(content):
+            if 'REDACTED' not in match.group():
+                violations.append(message)
                 break
     
     return (len(violations) == 0, violations)
@@ -410,22 +620,65 @@ def safe_sanitize(content: str) -> str:
 # PARSER
 # =============================================================================
 
-def parse_jsonl(path: Path) -> Iterator[dict]:
-    """Stream parse a JSONL file, yielding records."""
-    with open(path, 'r', encoding='utf-8') as f:
+def parse_jsonl(
+    path: Path,
+    raw_substr: Optional[str] = None,
+    start_offset: int = 0,
+    type_markers: Optional[tuple[bytes, ...]] = None
+) -> Iterator[dict]:
+    """Stream parse a JSONL file, yielding records.
+
+    If raw_substr (lowercase) is given, lines that do not contain it are
+    skipped before decoding. Only pass a marker that survives JSON encoding
+    unchanged; see _raw_query_marker.
+
+    type_markers likewise skips lines containing none of the given byte
+    strings, e.g. (b'"compaction"',) for callers that only want one record
+    type. Matches can be false positives, so callers still check 'type'.
+
+    start_offset must be a line start (see find_date_offset); line numbers in
+    warnings are then relative to it.
+
+    Lines are read and decoded as bytes (orjson when installed), skipping a
+    separate UTF-8 decode of every line.
+    """
+    raw_bytes = raw_substr.encode('ascii') if raw_substr else None
+
+    with open(path, 'rb', buffering=JSONL_READ_BUFFER_SIZE) as f:
+        if start_offset:
+            f.seek(start_offset)
         for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
+            # Both decoders skip surrounding whitespace, so lines are not
+            # stripped (a copy per line); isspace() stops at the first '{'
+            if line.isspace():
+                continue
+            if type_markers is not None and not any(marker in line for marker in type_markers):
+                continue
+            # bytes.lower() folds ASCII only, so non-ASCII lines get the str check
+            if raw_bytes is not None and raw_bytes not in line.lower() and (
+                line.isascii() or raw_substr not in line.decode('utf-8', 'replace').lower()
+            ):
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError as e:
+                yield _json_loads(line)
+            except ValueError as e:
                 print(f"Warning: Skipping malformed JSON at {path}:{line_num} ({type(e).__name__})", file=sys.stderr)
 
 
+def dumps_json_pretty(obj) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when installed.
+
+    Same layout as json.dumps(obj, indent=2); orjson leaves non-ASCII text
+    unescaped, which is equally valid JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
 def get_session_metadata(path: Path) -> Optional[dict]:
     """Extract session record (first line with type: "session")."""
-    for record in parse_jsonl(path):
+    for record in parse_jsonl(path, type_markers=(b'"session"',)):
         if record.get('type') == 'session':
             return record
     return None
@@ -441,8 +694,8 @@ def _parse_timestamp(record: dict) -> Optional[datetime]:
         ts = record['timestamp']
         if isinstance(ts, str):
             try:
-                ts_str = ts.replace('Z', '+00:00')
-                return datetime.fromisoformat(ts_str)
+                # fromisoformat (C-implemented) parses a trailing 'Z' itself since 3.11
+                return datetime.fromisoformat(ts)
             except ValueError:
                 pass
         elif isinstance(ts, (int, float)):
@@ -459,146 +712,433 @@ def _parse_timestamp(record: dict) -> Optional[datetime]:
     return None
 
 
-def _extract_text_content(content: list) -> str:
-    """Extract text content from a content array."""
+def _summarize_content(content: list) -> tuple[str, bool, bool]:
+    """Return (text, has_tool_calls, has_thinking) for a content array in one pass."""
     texts = []
+    has_tool_calls = has_thinking = False
     for block in content:
-        if isinstance(block, dict) and block.get('type') == 'text':
+        if not isinstance(block, dict):
+            continue
+        block_type = block.get('type')
+        if block_type == 'text':
             text = block.get('text', '')
             if text:
                 texts.append(text)
-    return '\n'.join(texts)
+        elif block_type == 'toolCall':
+            has_tool_calls = True
+        elif block_type == 'thinking':
+            has_thinking = True
+    return '\n'.join(texts), has_tool_calls, has_thinking
 
 
-def _has_tool_calls(content: list) -> bool:
-    """Check if content contains tool calls."""
-    for block in content:
-        if isinstance(block, dict) and block.get('type') == 'toolCall':
-            return True
-    return False
+# Accepted message roles, mapped to the canonical (interned literal) string
+_MESSAGE_ROLES = {role: role for role in ('user', 'assistant', 'toolResult')}
 
 
-def _has_thinking(content: list) -> bool:
-    """Check if content contains thinking blocks."""
-    for block in content:
-        if isinstance(block, dict) and block.get('type') == 'thinking':
-            return True
-    return False
+def _intern(value):
+    """sys.intern() a str value, passing anything else (None, bad types) through.
 
+    Model and provider names repeat on every message of a session; interning
+    them at parse time keeps one copy per name in long-lived message lists.
+    """
+    return sys.intern(value) if type(value) is str else value
 
-def get_messages(path: Path, date_filter: Optional[date] = None) -> Iterator[Message]:
-    """Extract message records from a session log."""
-    for record in parse_jsonl(path):
+
+def _record_to_message(record: dict, date_filter: Optional[date] = None) -> Optional[Message]:
+    """Build a Message from a "message" record, or None if it should be skipped."""
+    msg = record.get('message', {})
+    if not msg:
+        return None
+
+    timestamp = _parse_timestamp(record)
+    if timestamp is None:
+        return None
+
+    # Apply date filter
+    if date_filter is not None:
+        if _local_date(timestamp) != date_filter:
+            return None
+
+    # One lookup validates the role and swaps the decoded copy for the shared
+    # literal, so role == 'user' checks downstream hit the identity fast path
+    role = _MESSAGE_ROLES.get(msg.get('role'))
+    if role is None:
+        return None
+
+    content = msg.get('content', [])
+    if not isinstance(content, list):
+        content = []
+
+    text_content, has_tool_calls, has_thinking = _summarize_content(content)
+
+    return Message(
+        id=record.get('id', ''),
+        timestamp=timestamp,
+        role=role,
+        text_content=text_content,
+        model=_intern(msg.get('model')),
+        provider=_intern(msg.get('provider')),
+        has_tool_calls=has_tool_calls,
+        has_thinking=has_thinking,
+    )
+
+
+def _record_to_transition(record: dict, state: dict, session_id: str) -> Optional[ModelTransition]:
+    """Update the running model state from a record; return a transition if one occurred.
+
+    ``state`` carries 'model' and 'provider' between calls and must start as
+    ``{'model': None, 'provider': None}`` for each session file.
+    """
+    record_type = record.get('type')
+
+    # Handle explicit model_change records
+    if record_type == 'model_change':
+        new_model = record.get('modelId')
+        new_provider = record.get('provider', '')
+        timestamp = _parse_timestamp(record)
+
+        if timestamp and new_model:
+            transition = ModelTransition(
+                timestamp=timestamp,
+                from_model=state['model'],
+                to_model=new_model,
+                session_id=session_id,
+                provider=new_provider,
+                from_provider=state['provider'],
+            )
+            state['model'] = new_model
+            state['provider'] = new_provider
+            return transition
+
+    # Track model from messages too
+    elif record_type == 'message':
+        msg = record.get('message', {})
+        model = msg.get('model')
+        provider = msg.get('provider')
+
+        if model and model != state['model']:
+            timestamp = _parse_timestamp(record)
+            if timestamp:
+                transition = None
+                if state['model'] is not None:
+                    transition = ModelTransition(
+                        timestamp=timestamp,
+                        from_model=state['model'],
+                        to_model=model,
+                        session_id=session_id,
+                        provider=provider or '',
+                        from_provider=state['provider'],
+                    )
+                state['model'] = model
+                state['provider'] = provider
+                return transition
+
+    return None
+
+
+def _record_to_compaction(record: dict) -> dict:
+    """Build a compaction summary dict from a "compaction" record."""
+    return {
+        'id': record.get('id'),
+        'timestamp': _parse_timestamp(record),
+        'summary': record.get('summary', ''),
+        'firstKeptEntryId': record.get('firstKeptEntryId'),
+        'tokensBefore': record.get('tokensBefore'),
+        'details': record.get('details', {}),
+    }
+
+
+def _raw_query_marker(query: str) -> Optional[str]:
+    """Return a lowercase marker safe to match against raw JSONL lines, or None.
+
+    Non-ASCII, quotes, backslashes and control characters may be escaped in
+    the log, so queries containing them can't be prechecked on the raw line.
+    """
+    marker = query.lower()
+    if not marker or not marker.isascii() or '"' in marker or '\\' in marker:
+        return None
+    if not marker.isprintable():
+        return None
+    return marker
+
+
+def _line_local_date(line: bytes) -> Optional[date]:
+    """LOCAL_TZ date of a raw JSONL line's record, or None if it has no timestamp."""
+    try:
+        timestamp = _parse_timestamp(_json_loads(line))
+    except (ValueError, AttributeError, TypeError):
+        return None
+    return _local_date(timestamp) if timestamp is not None else None
+
+
+def _line_message_date(line: bytes) -> Optional[date]:
+    """Like _line_local_date, but None unless the line is a "message" record."""
+    if b'"message"' not in line:
+        return None
+    try:
+        record = _json_loads(line)
+        if record.get('type') != 'message':
+            return None
+        timestamp = _parse_timestamp(record)
+    except (ValueError, AttributeError, TypeError):
+        return None
+    return _local_date(timestamp) if timestamp is not None else None
+
+
+def find_date_offset(path: Path, target_date: date, min_bytes: int = DATE_SEEK_MIN_BYTES) -> int:
+    """Byte offset of a line start at or before the first record dated target_date.
+
+    Session logs are append-only, so record timestamps increase through the
+    file and the start of a day can be bisected on byte offsets, parsing only
+    ~log2(size / DATE_SEEK_WINDOW_BYTES) probe lines. Files under min_bytes
+    return 0 (a linear read is cheaper than seeking).
+    """
+    size = path.stat().st_size
+    if size < min_bytes:
+        return 0
+
+    lo, hi = 0, size
+    with open(path, 'rb') as f:
+        while hi - lo > DATE_SEEK_WINDOW_BYTES:
+            mid = (lo + hi) // 2
+            f.seek(mid)
+            f.readline()  # skip the partial line
+
+            probe_date = None
+            while f.tell() < hi:
+                line = f.readline()
+                if not line:
+                    break
+                probe_date = _line_local_date(line)
+                if probe_date is not None:
+                    break
+
+            if probe_date is not None and probe_date < target_date:
+                lo = f.tell()
+            else:
+                hi = mid
+
+    return lo
+
+
+def build_message_filter(
+    model: Optional[str] = None,
+    query: Optional[str] = None
+) -> Optional[Callable[[Message], bool]]:
+    """Build a predicate for exactly the filters given, or None if there are none.
+
+    Each combination gets its own closure so per-message checks don't re-test
+    which options were set. The model compare runs before the query check,
+    since it avoids lowercasing the message text.
+    """
+    query_lower = query.lower() if query else None
+
+    if model and query_lower:
+        return lambda m: m.model == model and query_lower in m.text_content.lower()
+    if model:
+        return lambda m: m.model == model
+    if query_lower:
+        return lambda m: query_lower in m.text_content.lower()
+    return None
+
+
+def get_messages(
+    path: Path,
+    date_filter: Optional[date] = None,
+    raw_substr: Optional[str] = None,
+) -> Iterator[Message]:
+    """Extract message records from a session log.
+
+    raw_substr is a cheap line-level prefilter (see parse_jsonl); callers must
+    still apply their exact text filter to the yielded messages.
+
+    With date_filter, large files are entered at find_date_offset and read
+    stops once records are past the day. Both bounds keep a one-day margin so
+    slightly out-of-order timestamps around midnight are not lost.
+    """
+    start_offset = 0
+    stop_after: Optional[date] = None
+    if date_filter is not None:
+        start_offset = find_date_offset(path, date_filter - timedelta(days=1))
+        stop_after = date_filter + timedelta(days=1)
+
+    for record in parse_jsonl(path, raw_substr, start_offset, type_markers=(b'"message"',)):
         if record.get('type') != 'message':
             continue
 
-        msg = record.get('message', {})
-        if not msg:
+        message = _record_to_message(record, date_filter)
+        if message is not None:
+            yield message
+        elif stop_after is not None:
+            timestamp = _parse_timestamp(record)
+            if timestamp is not None and _local_date(timestamp) > stop_after:
+                break
+
+
+def iter_extract_matches(
+    path: Path,
+    date_filter: Optional[date] = None,
+    model: Optional[str] = None,
+    query: Optional[str] = None
+) -> Iterator[Message]:
+    """Messages in one session log matching extract's filters, with sanitized text.
+
+    Everything per-message (parse, filter, sanitize) happens here, so this can
+    run in a worker process and only matches cross back to the caller.
+    """
+    raw_substr = _raw_query_marker(query) if query else None
+    matches = build_message_filter(model, query)
+
+    messages = get_messages(path, date_filter=date_filter, raw_substr=raw_substr)
+    if matches:
+        messages = filter(matches, messages)
+    for message in messages:
+        yield replace(message, text_content=sanitize_content(message.text_content))
+
+
+def collect_extract_matches(
+    path: Path,
+    date_filter: Optional[date] = None,
+    model: Optional[str] = None,
+    query: Optional[str] = None
+) -> list[Message]:
+    """List form of iter_extract_matches, for process pool workers."""
+    return list(iter_extract_matches(path, date_filter, model, query))
+
+
+def get_model_transitions(path: Path) -> Iterator[ModelTransition]:
+    """Extract model transitions from a session log.
+
+    The session record is picked up in the same pass. Transitions seen before
+    it (normally none, as it is the first line) are held back so every
+    transition carries the session id.
+    """
+    session_id: Optional[str] = None
+    pending: list[ModelTransition] = []
+    state: dict = {'model': None, 'provider': None}
+
+    # Only model_change and message records move the model state
+    for record in parse_jsonl(path, type_markers=(b'"session"', b'"model_change"', b'"message"')):
+        if session_id is None and record.get('type') == 'session':
+            session_id = record.get('id', path.stem)
+            for transition in pending:
+                transition.session_id = session_id
+            yield from pending
+            pending.clear()
             continue
 
-        timestamp = _parse_timestamp(record)
-        if timestamp is None:
+        transition = _record_to_transition(record, state, session_id or path.stem)
+        if transition is None:
             continue
+        if session_id is None:
+            pending.append(transition)
+        else:
+            yield transition
+
+    yield from pending
 
-        # Apply date filter
-        if date_filter is not None:
-            if _local_date(timestamp) != date_filter:
-                continue
 
-        role = msg.get('role')
-        if role not in ('user', 'assistant', 'toolResult'):
+def get_compactions(path: Path) -> Iterator[dict]:
+    """Extract compaction summaries from a session log."""
+    for record in parse_jsonl(path, type_markers=(b'"compaction"',)):
+        if record.get('type') != 'compaction':
             continue
 
-        content = msg.get('content', [])
-        if not isinstance(content, list):
-            content = []
-
-        text_content = _extract_text_content(content)
-
-        yield Message(
-            id=record.get('id', ''),
-            timestamp=timestamp,
-            role=role,
-            text_content=text_content,
-            model=msg.get('model'),
-            provider=msg.get('provider'),
-            has_tool_calls=_has_tool_calls(content),
-            has_thinking=_has_thinking(content),
-        )
+        yield _record_to_compaction(record)
 
 
-def get_model_transitions(path: Path) -> Iterator[ModelTransition]:
-    """Extract model transitions from a session log."""
-    session_meta = get_session_metadata(path)
-    session_id = session_meta.get('id', path.stem) if session_meta else path.stem
+def iter_session_events(path: Path) -> Iterator[object]:
+    """Stream a session log's session record, messages and transitions in one pass.
 
-    current_model: Optional[str] = None
-    current_provider: Optional[str] = None
+    Yields the first session record (a dict), Message objects and
+    ModelTransition objects in file order. It replaces separate
+    get_session_metadata, get_messages and get_model_transitions passes.
+    Transitions are named with the session id, so any seen before a late
+    session record are held back until it (or the end of the file).
+    """
+    session_id: Optional[str] = None
+    pending: list[ModelTransition] = []
+    state: dict = {'model': None, 'provider': None}
 
-    for record in parse_jsonl(path):
+    for record in parse_jsonl(path, type_markers=(b'"session"', b'"model_change"', b'"message"')):
         record_type = record.get('type')
 
-        # Handle explicit model_change records
-        if record_type == 'model_change':
-            new_model = record.get('modelId')
-            new_provider = record.get('provider', '')
-            timestamp = _parse_timestamp(record)
+        if record_type == 'session' and session_id is None:
+            session_id = record.get('id', path.stem)
+            yield record
+            for transition in pending:
+                transition.session_id = session_id
+            yield from pending
+            pending.clear()
+            continue
 
-            if timestamp and new_model:
-                yield ModelTransition(
-                    timestamp=timestamp,
-                    from_model=current_model,
-                    to_model=new_model,
-                    session_id=session_id,
-                    provider=new_provider,
-                    from_provider=current_provider,
-                )
-                current_model = new_model
-                current_provider = new_provider
+        if record_type == 'message':
+            message = _record_to_message(record)
+            if message is not None:
+                yield message
+
+        transition = _record_to_transition(record, state, session_id or path.stem)
+        if transition is not None:
+            if session_id is None:
+                pending.append(transition)
+            else:
+                yield transition
 
-        # Track model from messages too
-        elif record_type == 'message':
-            msg = record.get('message', {})
-            model = msg.get('model')
-            provider = msg.get('provider')
+    yield from pending
 
-            if model and model != current_model:
-                timestamp = _parse_timestamp(record)
-                if timestamp:
-                    if current_model is not None:
-                        yield ModelTransition(
-                            timestamp=timestamp,
-                            from_model=current_model,
-                            to_model=model,
-                            session_id=session_id,
-                            provider=provider or '',
-                            from_provider=current_provider,
-                        )
-                    current_model = model
-                    current_provider = provider
 
+def scan_session_file(path: Path, date_filter: Optional[date] = None) -> SessionScan:
+    """Collect messages, transitions and compactions from a session log in one pass.
+
+    Equivalent to calling get_messages, get_model_transitions and get_compactions
+    separately, but the file is read and JSON-decoded only once. When date_filter
+    is given, all three lists are restricted to that local date, and reading
+    stops at the first message more than a day past it (as in get_messages).
+    """
+    scan = SessionScan(session_id=path.stem)
+    session_found = False
+    state: dict = {'model': None, 'provider': None}
+    stop_after = date_filter + timedelta(days=1) if date_filter is not None else None
 
-def get_compactions(path: Path) -> Iterator[dict]:
-    """Extract compaction summaries from a session log."""
     for record in parse_jsonl(path):
-        if record.get('type') != 'compaction':
+        record_type = record.get('type')
+
+        if record_type == 'session' and not session_found:
+            scan.session_id = record.get('id', path.stem)
+            session_found = True
             continue
 
-        timestamp = _parse_timestamp(record)
+        if record_type == 'message':
+            message = _record_to_message(record, date_filter)
+            if message is not None:
+                scan.messages.append(message)
+            elif stop_after is not None and session_found:
+                # Later records can only add to later days; a session record
+                # must have been seen, as it would rename the transitions
+                timestamp = _parse_timestamp(record)
+                if timestamp is not None and _local_date(timestamp) > stop_after:
+                    break
+        elif record_type == 'compaction':
+            comp = _record_to_compaction(record)
+            if date_filter is None or (comp['timestamp'] and _local_date(comp['timestamp']) == date_filter):
+                scan.compactions.append(comp)
 
-        yield {
-            'id': record.get('id'),
-            'timestamp': timestamp,
-            'summary': record.get('summary', ''),
-            'firstKeptEntryId': record.get('firstKeptEntryId'),
-            'tokensBefore': record.get('tokensBefore'),
-            'details': record.get('details', {}),
-        }
+        # Model state must see every record, even those outside the date filter
+        transition = _record_to_transition(record, state, scan.session_id)
+        if transition is not None:
+            if date_filter is None or _local_date(transition.timestamp) == date_filter:
+                scan.transitions.append(transition)
+
+    # A session record that appears late still names every transition in the file
+    for transition in scan.transitions:
+        transition.session_id = scan.session_id
+
+    return scan
 
 
 def get_model_snapshots(path: Path) -> Iterator[dict]:
     """Extract model-snapshot custom records for transition tracking."""
-    for record in parse_jsonl(path):
+    for record in parse_jsonl(path, type_markers=(b'"model-snapshot"',)):
         if record.get('type') != 'custom':
             continue
         if record.get('customType') != 'model-snapshot':
@@ -620,18 +1160,242 @@ def get_model_snapshots(path: Path) -> Iterator[dict]:
 # SESSION DISCOVERY
 # =============================================================================
 
+def scan_session_files(sessions_dir: Path) -> list[SessionFileMeta]:
+    """List session JSONL files with one stat() each, oldest mtime first.
+
+    Uses os.scandir: entry types come from readdir, so only .jsonl files are
+    ever stat()ed (and *.jsonl.lock never match the suffix check).
+    """
+    try:
+        entries = os.scandir(sessions_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    metas = []
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('.jsonl') or not entry.is_file():
+                continue
+            st = entry.stat()
+            metas.append(SessionFileMeta(path=sessions_dir / entry.name, size=st.st_size, mtime=st.st_mtime))
+
+    metas.sort(key=attrgetter('mtime'))
+    return metas
+
+
+# Memoized find_session_files listings: {sessions_dir: (dir st_mtime_ns, files)}
+_session_files_cache: dict[Path, tuple[int, list[Path]]] = {}
+
+
+def clear_session_cache() -> None:
+    """Forget memoized find_session_files listings."""
+    _session_files_cache.clear()
+
+
 def find_session_files(sessions_dir: Path) -> list[Path]:
-    """Find all session JSONL files in a directory."""
-    if not sessions_dir.exists():
+    """Find all session JSONL files in a directory.
+
+    Memoized on the directory's mtime, which changes when logs are added,
+    removed or renamed. Appending to a log doesn't change it, so the mtime
+    ordering of a memoized listing can lag; callers order records by
+    timestamp, not by file.
+    """
+    try:
+        dir_mtime_ns = sessions_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
 
+    cached = _session_files_cache.get(sessions_dir)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        return list(cached[1])
+
+    files = [m.path for m in scan_session_files(sessions_dir)]
+    if time.time() - dir_mtime_ns / 1e9 >= SESSION_LIST_CACHE_MIN_AGE_SECONDS:
+        _session_files_cache[sessions_dir] = (dir_mtime_ns, files)
+    return list(files)
+
+
+def filter_files_by_date(files: list[Path], target_date: date, buffer_days: int = 1) -> list[Path]:
+    """Drop session files last modified before target_date, without opening them.
+
+    Logs are append-only, so a file's mtime is at or after its newest record;
+    a file untouched since before the target day cannot contain it. The buffer
+    absorbs timezone skew between the mtime and LOCAL_TZ day bucketing.
+    """
+    cutoff = target_date - timedelta(days=buffer_days)
+    return [
+        f for f in files
+        if datetime.fromtimestamp(f.stat().st_mtime, LOCAL_TZ).date() >= cutoff
+    ]
+
+
+def _file_date_bounds(
+    path: Path,
+    line_date: Callable[[bytes], Optional[date]] = _line_local_date
+) -> tuple[Optional[date], Optional[date]]:
+    """First and last record dates of a log, reading only its head and tail.
+
+    line_date picks which lines count; _line_message_date limits the bounds
+    to messages (reading further in when the ends are other records).
+    """
+    first_date: Optional[date] = None
+    last_date: Optional[date] = None
+
+    with open(path, 'rb') as f:
+        for line in f:
+            first_date = line_date(line)
+            if first_date is not None:
+                break
+
+        # Walk backwards a block at a time until a complete line has a timestamp
+        pos = f.seek(0, os.SEEK_END)
+        partial = b''
+        while pos > 0 and last_date is None:
+            read_start = max(0, pos - DATE_SEEK_WINDOW_BYTES)
+            f.seek(read_start)
+            lines = (f.read(pos - read_start) + partial).split(b'\n')
+            pos = read_start
+            # lines[0] may continue into the previous block
+            partial = lines.pop(0) if pos > 0 else b''
+            for line in reversed(lines):
+                if line.strip():
+                    last_date = line_date(line)
+                    if last_date is not None:
+                        break
+
+    return first_date, last_date
+
+
+def _sessions_dir_key(sessions_dir: Path) -> str:
+    """Stable file-name-safe key for a sessions directory (its resolved path)."""
+    import hashlib
+
+    return hashlib.sha256(str(sessions_dir.resolve()).encode('utf-8')).hexdigest()[:16]
+
+
+def get_session_index_path(sessions_dir: Path) -> Path:
+    """Path of the date index manifest for sessions_dir (see load_session_date_index)."""
+    return SESSION_INDEX_DIR / f"{_sessions_dir_key(sessions_dir)}.json"
+
+
+def get_session_activity_path(sessions_dir: Path) -> Path:
+    """Path of the activity manifest for sessions_dir (see load_session_activity)."""
+    return SESSION_CACHE_DIR / f"activity-v{SESSION_ACTIVITY_VERSION}-{_sessions_dir_key(sessions_dir)}.json"
+
+
+def _write_manifest(path: Path, data: dict) -> None:
+    """Write a JSON manifest atomically (tmp file + os.replace); best-effort.
+
+    Concurrent runs each write their own tmp file, so readers see either the
+    old or the new manifest, never a partial one.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:  # e.g. NotADirectoryError when the parent is a file
+            pass
+
+
+def _keep_unlisted_entries(sessions_dir: Path, cached: dict, entries: dict) -> None:
+    """Copy cached manifest entries for logs outside this call into entries.
+
+    Callers often pass a filtered file list; entries for other logs that
+    still exist are kept so the rewrite doesn't evict them.
+    """
+    unlisted = cached.keys() - entries.keys()
+    if unlisted:
+        live = {path.name for path in find_session_files(sessions_dir)}
+        for name in unlisted & live:
+            entries[name] = cached[name]
+
+
+def load_session_date_index(
+    sessions_dir: Path,
+    metas: list[SessionFileMeta],
+    messages_only: bool = False
+) -> dict[str, tuple[Optional[date], Optional[date]]]:
+    """Map each listed log's filename to its (first, last) record date.
+
+    With messages_only, the bounds are those of "message" records alone, so
+    headers, model changes and compactions don't widen a log's range and a
+    log without messages maps to (None, None). Each pair is read on first
+    request.
+
+    Bounds are cached in a manifest under SESSION_INDEX_DIR (never inside
+    sessions_dir) and reused while a file's mtime and size are unchanged, so
+    only new or appended logs are read. The manifest is best-effort: an
+    unreadable or unwritable one just means the bounds are recomputed.
+    """
+    first_key, last_key = ('first_message_date', 'last_message_date') if messages_only else ('first_date', 'last_date')
+
+    index_path = get_session_index_path(sessions_dir)
+    try:
+        manifest = json.loads(index_path.read_text(encoding='utf-8'))
+        if manifest.get('version') != SESSION_INDEX_VERSION:
+            manifest = {}
+    except (OSError, ValueError, AttributeError):
+        manifest = {}
+    cached: dict = manifest.get('files', {})
+
+    entries: dict = {}
+    changed = False
+    for meta in metas:
+        entry = cached.get(meta.path.name)
+        if entry is None or entry.get('mtime') != meta.mtime or entry.get('size') != meta.size:
+            entry = {'mtime': meta.mtime, 'size': meta.size}
+        if first_key not in entry:
+            first_date, last_date = _file_date_bounds(
+                meta.path, _line_message_date if messages_only else _line_local_date
+            )
+            entry[first_key] = first_date.isoformat() if first_date else None
+            entry[last_key] = last_date.isoformat() if last_date else None
+            changed = True
+        entries[meta.path.name] = entry
+
+    bounds = {
+        name: (
+            date.fromisoformat(entry[first_key]) if entry[first_key] else None,
+            date.fromisoformat(entry[last_key]) if entry[last_key] else None,
+        )
+        for name, entry in entries.items()
+    }
+
+    _keep_unlisted_entries(sessions_dir, cached, entries)
+    if changed or entries.keys() != cached.keys():
+        _write_manifest(index_path, {'version': SESSION_INDEX_VERSION, 'files': entries})
+
+    return bounds
+
+
+def find_session_files_for_date(sessions_dir: Path, target_date: date) -> list[Path]:
+    """Session files that can contain records on target_date, oldest mtime first.
+
+    Files last modified before the day are dropped on mtime alone (as in
+    filter_files_by_date); the rest are checked against the cached date
+    manifest (see load_session_date_index). Bounds get a one-day margin for
+    timezone skew, and files without known bounds are kept.
+    """
+    margin = timedelta(days=1)
+    cutoff = target_date - margin
+    metas = [
+        m for m in scan_session_files(sessions_dir)
+        if datetime.fromtimestamp(m.mtime, LOCAL_TZ).date() >= cutoff
+    ]
+    bounds = load_session_date_index(sessions_dir, metas)
+
     files = []
-    for f in sessions_dir.glob('*.jsonl'):
-        if f.suffix == '.lock' or f.name.endswith('.jsonl.lock'):
+    for meta in metas:
+        first_date, last_date = bounds[meta.path.name]
+        if first_date is not None and first_date - margin > target_date:
             continue
-        files.append(f)
-
-    files.sort(key=lambda p: p.stat().st_mtime)
+        if last_date is not None and last_date + margin < target_date:
+            continue
+        files.append(meta.path)
     return files
 
 
@@ -645,24 +1409,221 @@ def _local_date(dt: datetime) -> date:
     return dt.date()
 
 
-def get_date_range(sessions_dir: Path) -> tuple[Optional[date], Optional[date]]:
-    """Get the date range of activity across all session files (bucketed by LOCAL_TZ)."""
-    first_date: Optional[date] = None
-    last_date: Optional[date] = None
+def local_date_bucketer() -> Callable[[datetime], date]:
+    """Return a _local_date equivalent for scanning records in time order.
+
+    Consecutive records mostly fall on the same local day, so the last day's
+    [midnight, next midnight) bounds are kept (in UTC) and a UTC timestamp
+    inside them gets that day from two comparisons instead of a time zone
+    conversion. Other timestamps are converted as usual.
+    """
+    start = end = day = None
 
-    for session_file in find_session_files(sessions_dir):
-        for msg in get_messages(session_file):
-            msg_date = _local_date(msg.timestamp)
+    def local_date(dt: datetime) -> date:
+        nonlocal start, end, day
+        if dt.tzinfo is not timezone.utc:
+            return _local_date(dt)
+        if start is None or not start <= dt < end:
+            day = _local_date(dt)
+            following = day + timedelta(days=1)
+            start = datetime(day.year, day.month, day.day, tzinfo=LOCAL_TZ).astimezone(timezone.utc)
+            end = datetime(following.year, following.month, following.day, tzinfo=LOCAL_TZ).astimezone(timezone.utc)
+        return day
 
-            if first_date is None or msg_date < first_date:
-                first_date = msg_date
-            if last_date is None or msg_date > last_date:
-                last_date = msg_date
+    return local_date
+
+
+def merge_by_timestamp(runs: list[list]) -> list:
+    """Merge per-file lists of Messages/ModelTransitions into one chronological list.
+
+    Session logs are append-only, so each run is normally already in order and
+    sorting it is a linear check; the runs are then k-way merged rather than
+    concatenated and fully re-sorted. Ties keep file order, like a stable sort.
+    """
+    by_timestamp = attrgetter('timestamp')
+    return list(heapq.merge(*(sorted(run, key=by_timestamp) for run in runs), key=by_timestamp))
+
+
+def parse_workers(session_files: list[Path]) -> int:
+    """Return how many processes a scan of session_files should use (1 = in-process)."""
+    workers = min(os.cpu_count() or 1, len(session_files))
+    if workers > 1 and sum(f.stat().st_size for f in session_files) >= PARALLEL_PARSE_MIN_BYTES:
+        return workers
+    return 1
+
+
+def map_session_files(fn: Callable, session_files: list[Path], *args) -> Iterator:
+    """Yield fn(path, *args) for each session file, in order.
+
+    Parsing is CPU-bound (JSON decode, sanitize) and files are independent, so
+    large scans (see parse_workers) are spread over a process pool; fn and its
+    results must then be picklable. Small scans run lazily in-process.
+    """
+    workers = parse_workers(session_files)
+    if workers == 1:
+        return (fn(path, *args) for path in session_files)
+
+    from concurrent.futures import ProcessPoolExecutor
+    executor = ProcessPoolExecutor(max_workers=workers)
+    n = len(session_files)
+    results = executor.map(
+        fn, session_files, *([arg] * n for arg in args),
+        chunksize=max(1, n // (workers * 4)),
+    )
+    # Every file is already submitted; workers exit once the queue drains
+    executor.shutdown(wait=False)
+    return results
 
-    return first_date, last_date
 
+def get_date_range(
+    sessions_dir: Path,
+    session_files: Optional[list[Path]] = None
+) -> tuple[Optional[date], Optional[date]]:
+    """Get the date range of activity across all session files (bucketed by LOCAL_TZ).
+
+    Logs are append-only, so each one's range is its first and last message
+    date, read from its head and tail and cached in the date index (see
+    load_session_date_index) instead of parsing every message. Logs without
+    messages don't count.
+    """
+    if session_files is None:
+        metas = scan_session_files(sessions_dir)
+    else:
+        metas = []
+        for path in session_files:
+            st = path.stat()
+            metas.append(SessionFileMeta(path=path, size=st.st_size, mtime=st.st_mtime))
+
+    bounds = load_session_date_index(sessions_dir, metas, messages_only=True).values()
+    firsts = [first for first, _ in bounds if first is not None]
+    lasts = [last for _, last in bounds if last is not None]
+
+    return (min(firsts) if firsts else None, max(lasts) if lasts else None)
+
+
+def _session_file_activity(session_file: Path) -> tuple[str, dict[date, dict], list[ModelTransition]]:
+    """Per-date message tallies and the transitions of one session log.
+
+    Worker for collect_daily_activity; reads the file once (see
+    iter_session_events) and returns plain (picklable) containers.
+    """
+    session_id = session_file.stem
+    tallies: dict[date, dict] = {}
+    transitions: list[ModelTransition] = []
+    local_date = local_date_bucketer()
+
+    for event in iter_session_events(session_file):
+        if isinstance(event, ModelTransition):
+            transitions.append(event)
+            continue
+        if not isinstance(event, Message):
+            session_id = event.get('id', session_file.stem)
+            continue
 
-def collect_daily_activity(sessions_dir: Path) -> dict[date, DayActivity]:
+        msg_date = local_date(event.timestamp)
+        data = tallies.get(msg_date)
+        if data is None:
+            data = tallies[msg_date] = {
+                'message_count': 0,
+                'user_messages': 0,
+                'assistant_messages': 0,
+                'tool_result_messages': 0,
+                'models': set(),
+            }
+
+        data['message_count'] += 1
+
+        if event.role == 'user':
+            data['user_messages'] += 1
+        elif event.role == 'assistant':
+            data['assistant_messages'] += 1
+            if event.model:
+                data['models'].add(event.model)
+        elif event.role == 'toolResult':
+            data['tool_result_messages'] += 1
+
+    return session_id, tallies, transitions
+
+
+def _activity_to_json(session_id: str, tallies: dict[date, dict], transitions: list[ModelTransition]) -> dict:
+    """Encode a _session_file_activity result for the activity manifest."""
+    return {
+        'session_id': session_id,
+        'days': {
+            day.isoformat(): {**tally, 'models': sorted(tally['models'])}
+            for day, tally in tallies.items()
+        },
+        'transitions': [
+            {**asdict(t), 'timestamp': t.timestamp.isoformat()} for t in transitions
+        ],
+    }
+
+
+def _activity_from_json(entry: dict) -> tuple[str, dict[date, dict], list[ModelTransition]]:
+    """Decode an activity manifest entry (inverse of _activity_to_json)."""
+    tallies = {
+        date.fromisoformat(day): {**tally, 'models': set(tally['models'])}
+        for day, tally in entry['days'].items()
+    }
+    transitions = [
+        ModelTransition(**{**t, 'timestamp': datetime.fromisoformat(t['timestamp'])})
+        for t in entry['transitions']
+    ]
+    return entry['session_id'], tallies, transitions
+
+
+def load_session_activity(
+    sessions_dir: Path,
+    session_files: list[Path]
+) -> list[tuple[str, dict[date, dict], list[ModelTransition]]]:
+    """Per-file activity (see _session_file_activity) for each session log, in order.
+
+    Results are cached in a manifest under SESSION_CACHE_DIR (never inside
+    sessions_dir) and reused while a file's mtime and size are unchanged, so
+    repeat runs only parse new or appended logs. Like the date index, the
+    manifest is best-effort.
+    """
+    manifest_path = get_session_activity_path(sessions_dir)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if manifest.get('version') != SESSION_ACTIVITY_VERSION:
+            manifest = {}
+    except (OSError, ValueError, AttributeError):
+        manifest = {}
+    cached: dict = manifest.get('files', {})
+
+    entries: dict = {}
+    results: dict[Path, tuple] = {}
+    stale: list[Path] = []
+    for path in session_files:
+        st = path.stat()
+        entry = cached.get(path.name)
+        if entry is not None and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+            try:
+                results[path] = _activity_from_json(entry)
+                entries[path.name] = entry
+                continue
+            except (KeyError, TypeError, ValueError):
+                pass
+        stale.append(path)
+        entries[path.name] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+    # Stat before parsing: a log appended in between is just re-read next run
+    for path, activity in zip(stale, map_session_files(_session_file_activity, stale)):
+        results[path] = activity
+        entries[path.name].update(_activity_to_json(*activity))
+
+    _keep_unlisted_entries(sessions_dir, cached, entries)
+    if stale or entries.keys() != cached.keys():
+        _write_manifest(manifest_path, {'version': SESSION_ACTIVITY_VERSION, 'files': entries})
+
+    return [results[path] for path in session_files]
+
+
+def collect_daily_activity(
+    sessions_dir: Path,
+    session_files: Optional[list[Path]] = None
+) -> dict[date, DayActivity]:
     """Collect activity summary for each day across all sessions."""
     daily_data: dict[date, dict] = defaultdict(lambda: {
         'message_count': 0,
@@ -674,29 +1635,20 @@ def collect_daily_activity(sessions_dir: Path) -> dict[date, DayActivity]:
         'session_ids': set(),
     })
 
-    session_files = find_session_files(sessions_dir)
+    if session_files is None:
+        session_files = find_session_files(sessions_dir)
 
-    for session_file in session_files:
-        session_meta = get_session_metadata(session_file)
-        session_id = session_meta.get('id', session_file.stem) if session_meta else session_file.stem
-
-        for msg in get_messages(session_file):
-            msg_date = _local_date(msg.timestamp)
+    for session_id, tallies, transitions in load_session_activity(sessions_dir, session_files):
+        for msg_date, tally in tallies.items():
             data = daily_data[msg_date]
-
-            data['message_count'] += 1
+            data['message_count'] += tally['message_count']
+            data['user_messages'] += tally['user_messages']
+            data['assistant_messages'] += tally['assistant_messages']
+            data['tool_result_messages'] += tally['tool_result_messages']
+            data['models'] |= tally['models']
             data['session_ids'].add(session_id)
 
-            if msg.role == 'user':
-                data['user_messages'] += 1
-            elif msg.role == 'assistant':
-                data['assistant_messages'] += 1
-                if msg.model:
-                    data['models'].add(msg.model)
-            elif msg.role == 'toolResult':
-                data['tool_result_messages'] += 1
-
-        for transition in get_model_transitions(session_file):
+        for transition in transitions:
             trans_date = _local_date(transition.timestamp)
             daily_data[trans_date]['transitions'].append(transition)
 
@@ -716,11 +1668,38 @@ def collect_daily_activity(sessions_dir: Path) -> dict[date, DayActivity]:
     return result
 
 
+def build_session_index(
+    sessions_dir: Path,
+    session_files: Optional[list[Path]] = None
+) -> dict[date, DayRecords]:
+    """Bucket every session record by local date, parsing each file exactly once.
+
+    Lets multi-date callers (e.g. backfill_all_missing) look days up instead of
+    re-scanning the whole sessions directory for every date.
+    """
+    index: dict[date, DayRecords] = defaultdict(DayRecords)
+
+    if session_files is None:
+        session_files = find_session_files(sessions_dir)
+
+    for scan in map_session_files(scan_session_file, session_files):
+        local_date = local_date_bucketer()
+        for msg in scan.messages:
+            index[local_date(msg.timestamp)].messages.append(msg)
+
+        for trans in scan.transitions:
+            index[_local_date(trans.timestamp)].transitions.append(trans)
+
+        for comp in scan.compactions:
+            if comp['timestamp'] and comp.get('summary'):
+                index[_local_date(comp['timestamp'])].compaction_summary = comp['summary']
+
+    return dict(index)
+
+
 def get_session_info(session_file: Path) -> dict:
     """Get summary information about a single session file."""
-    session_meta = get_session_metadata(session_file)
-    session_id = session_meta.get('id', session_file.stem) if session_meta else session_file.stem
-
+    session_meta: Optional[dict] = None
     file_size = session_file.stat().st_size
 
     message_count = 0
@@ -730,10 +1709,19 @@ def get_session_info(session_file: Path) -> dict:
     first_date: Optional[date] = None
     last_date: Optional[date] = None
     models: set[str] = set()
+    transition_count = 0
+
+    local_date = local_date_bucketer()
+    for msg in iter_session_events(session_file):
+        if isinstance(msg, ModelTransition):
+            transition_count += 1
+            continue
+        if not isinstance(msg, Message):
+            session_meta = msg
+            continue
 
-    for msg in get_messages(session_file):
         message_count += 1
-        msg_date = _local_date(msg.timestamp)
+        msg_date = local_date(msg.timestamp)
 
         if first_date is None or msg_date < first_date:
             first_date = msg_date
@@ -749,10 +1737,8 @@ def get_session_info(session_file: Path) -> dict:
         elif msg.role == 'toolResult':
             tool_result_count += 1
 
-    transitions = list(get_model_transitions(session_file))
-
     return {
-        'session_id': session_id,
+        'session_id': session_meta.get('id', session_file.stem) if session_meta else session_file.stem,
         'file_path': str(session_file),
         'file_size': file_size,
         'message_count': message_count,
@@ -760,7 +1746,7 @@ def get_session_info(session_file: Path) -> dict:
         'assistant_messages': assistant_count,
         'tool_result_messages': tool_result_count,
         'models_used': sorted(models),
-        'transition_count': len(transitions),
+        'transition_count': transition_count,
         'date_range': (first_date, last_date),
         'metadata': session_meta,
     }
@@ -822,13 +1808,13 @@ def get_changed_days(sessions_dir: Path, since: datetime) -> set[date]:
     """Get set of dates with session activity since a given timestamp."""
     changed_days: set[date] = set()
     since_timestamp = since.timestamp()
+    local_date = local_date_bucketer()
     
-    for session_file in find_session_files(sessions_dir):
-        file_mtime = session_file.stat().st_mtime
-        
-        if file_mtime > since_timestamp:
-            for msg in get_messages(session_file):
-                changed_days.add(_local_date(msg.timestamp))
+    # The scan's mtimes come from its one stat() per file; no re-stat here
+    for meta in scan_session_files(sessions_dir):
+        if meta.mtime > since_timestamp:
+            for msg in get_messages(meta.path):
+                changed_days.add(local_date(msg.timestamp))
     
     return changed_days
 
@@ -847,17 +1833,88 @@ def get_last_run_datetime() -> Optional[datetime]:
         return None
 
 
+def load_checkpoint(checkpoint_path: Path) -> set[date]:
+    """Dates recorded as created in a backfill checkpoint file.
+    
+    The file is JSONL, one {"date", "status", "path"} record per processed
+    date. Lines that don't parse (e.g. cut short by a crash) are ignored.
+    """
+    done: set[date] = set()
+    try:
+        f = checkpoint_path.open('r', encoding='utf-8')
+    except FileNotFoundError:
+        return done
+    
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                if record.get('status') == 'created':
+                    done.add(date.fromisoformat(record['date']))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+                continue
+    
+    return done
+
+
+def append_checkpoint(checkpoint_path: Path, log_date: date, status: str, path: Optional[str] = None) -> None:
+    """Append one backfill result to the checkpoint and fsync it, so it survives a crash."""
+    _append_checkpoint_record(checkpoint_path, {"date": str(log_date), "status": status, "path": path})
+
+
+def append_checkpoint_batch(checkpoint_path: Path, batch_id: str) -> None:
+    """Record a submitted Anthropic batch id (load_checkpoint skips these records)."""
+    _append_checkpoint_record(checkpoint_path, {"batch_id": batch_id, "status": "submitted"})
+
+
+def _append_checkpoint_record(checkpoint_path: Path, record: dict) -> None:
+    """Append one JSON line to the checkpoint and fsync it.
+    
+    A crash mid-write can leave a torn last line with no newline; that line is
+    terminated first so the new record isn't glued onto it (and lost with it).
+    """
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    with checkpoint_path.open('a+b') as f:
+        line = json.dumps(record).encode('utf-8') + b"\n"
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 # =============================================================================
 # COMPARE (gap detection)
 # =============================================================================
 
-def find_gaps(sessions_dir: Path, memory_dir: Path, *, exclude_today: bool = True) -> dict:
+def find_gaps(
+    sessions_dir: Path,
+    memory_dir: Path,
+    *,
+    exclude_today: bool = True,
+    session_files: Optional[list[Path]] = None,
+    memory_files: Optional[list[MemoryFileMeta]] = None,
+    daily_activity: Optional[dict[date, DayActivity]] = None,
+    date_range: Optional[tuple[Optional[date], Optional[date]]] = None
+) -> dict:
     """Compare session logs against memory files to identify coverage gaps.
 
     By default, excludes *today* from coverage/sparsity checks because the day is usually still in progress
     (especially when this is run early morning by cron).
+
+    memory_files (from scan_memory_files) supplies sizes already stat()ed by the
+    caller; otherwise the memory dir is scanned once here. Likewise, callers that
+    already have collect_daily_activity / get_date_range results pass them as
+    daily_activity / date_range to avoid re-parsing the session logs.
     """
-    first_date, last_date = get_date_range(sessions_dir)
+    if session_files is None and (daily_activity is None or date_range is None):
+        session_files = find_session_files(sessions_dir)
+
+    if date_range is None:
+        date_range = get_date_range(sessions_dir, session_files)
+    first_date, last_date = date_range
 
     if first_date is None or last_date is None:
         return {
@@ -869,7 +1926,13 @@ def find_gaps(sessions_dir: Path, memory_dir: Path, *, exclude_today: bool = Tru
             'last_date': None,
         }
 
-    daily_activity = collect_daily_activity(sessions_dir)
+    if daily_activity is None:
+        daily_activity = collect_daily_activity(sessions_dir, session_files)
+
+    # One listing + stat per existing file, instead of exists() + stat() per active day
+    if memory_files is None:
+        memory_files = scan_memory_files(memory_dir)
+    memory_sizes = {m.date: m.size for m in memory_files}
 
     missing_gaps: list[MemoryGap] = []
     sparse_gaps: list[MemoryGap] = []
@@ -885,9 +1948,9 @@ def find_gaps(sessions_dir: Path, memory_dir: Path, *, exclude_today: bool = Tru
         if exclude_today and day == today_local:
             continue
 
-        memory_file = memory_dir / f"{day}.md"
+        file_size = memory_sizes.get(day)
 
-        if not memory_file.exists():
+        if file_size is None:
             missing_gaps.append(MemoryGap(
                 date=day,
                 gap_type='missing',
@@ -895,20 +1958,19 @@ def find_gaps(sessions_dir: Path, memory_dir: Path, *, exclude_today: bool = Tru
                 memory_file_size=0,
                 reason=f"No memory file for {activity.message_count} messages"
             ))
+        # Sparse if under MIN_FILE_SIZE_BYTES or under MIN_BYTES_PER_MESSAGE per message:
+        # one integer compare, dividing only to word the reason for sparse days
+        elif file_size < max(MIN_FILE_SIZE_BYTES, MIN_BYTES_PER_MESSAGE * activity.message_count):
+            bytes_per_msg = file_size / activity.message_count
+            sparse_gaps.append(MemoryGap(
+                date=day,
+                gap_type='sparse',
+                activity=activity,
+                memory_file_size=file_size,
+                reason=f"Only {file_size} bytes for {activity.message_count} messages ({bytes_per_msg:.1f} bytes/msg)"
+            ))
         else:
-            file_size = memory_file.stat().st_size
-            bytes_per_msg = file_size / activity.message_count if activity.message_count > 0 else 0
-
-            if file_size < MIN_FILE_SIZE_BYTES or bytes_per_msg < MIN_BYTES_PER_MESSAGE:
-                sparse_gaps.append(MemoryGap(
-                    date=day,
-                    gap_type='sparse',
-                    activity=activity,
-                    memory_file_size=file_size,
-                    reason=f"Only {file_size} bytes for {activity.message_count} messages ({bytes_per_msg:.1f} bytes/msg)"
-                ))
-            else:
-                covered_days += 1
+            covered_days += 1
 
     total_active_days = len(daily_activity)
     coverage_pct = (covered_days / total_active_days * 100) if total_active_days > 0 else 100.0
@@ -924,20 +1986,55 @@ def find_gaps(sessions_dir: Path, memory_dir: Path, *, exclude_today: bool = Tru
     }
 
 
+# Daily memory file names: exactly YYYY-MM-DD.md
+_MEMORY_FILENAME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})\.md')
+
+
+def parse_memory_filename(name: str) -> Optional[date]:
+    """Return the date of a YYYY-MM-DD.md file name, or None for anything else.
+
+    Shape is checked with a precompiled fullmatch before building the date, so
+    MEMORY.md, notes etc. cost no exception. Stricter than date.fromisoformat,
+    which since 3.11 also accepts forms like 20260115.
+    """
+    match = _MEMORY_FILENAME_RE.fullmatch(name)
+    if match is None:
+        return None
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+
+def _iter_memory_entries(memory_dir: Path) -> Iterator[tuple[date, os.DirEntry]]:
+    """Yield (date, DirEntry) for each daily memory file, in directory order."""
+    try:
+        entries = os.scandir(memory_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    with entries:
+        for entry in entries:
+            file_date = parse_memory_filename(entry.name)
+            if file_date is not None and entry.is_file():
+                yield file_date, entry
+
+
 def get_memory_files(memory_dir: Path) -> list[tuple[date, Path]]:
     """Get all memory files in the memory directory."""
-    if not memory_dir.exists():
-        return []
+    files = [(file_date, memory_dir / entry.name) for file_date, entry in _iter_memory_entries(memory_dir)]
+    files.sort(key=itemgetter(0))
+    return files
 
-    files = []
-    for f in memory_dir.glob('*.md'):
-        try:
-            file_date = date.fromisoformat(f.stem)
-            files.append((file_date, f))
-        except ValueError:
-            continue
 
-    return sorted(files, key=lambda x: x[0])
+def scan_memory_files(memory_dir: Path) -> list[MemoryFileMeta]:
+    """Like get_memory_files, but with each file's size from the scan's DirEntry.stat()."""
+    metas = [
+        MemoryFileMeta(date=file_date, path=memory_dir / entry.name, size=entry.stat().st_size)
+        for file_date, entry in _iter_memory_entries(memory_dir)
+    ]
+    metas.sort(key=attrgetter('date'))
+    return metas
 
 
 def find_orphaned_memory_files(sessions_dir: Path, memory_dir: Path) -> list[tuple[date, Path]]:
@@ -998,20 +2095,30 @@ def format_gap_report(gaps: dict) -> str:
 
 def extract_transitions(
     sessions_dir: Path,
-    since: Optional[date] = None
+    since: Optional[date] = None,
+    session_files: Optional[list[Path]] = None
 ) -> Iterator[ModelTransition]:
-    """Extract all model transitions from session logs."""
-    all_transitions: list[ModelTransition] = []
+    """Extract all model transitions from session logs, oldest first.
 
-    for session_file in find_session_files(sessions_dir):
-        for transition in get_model_transitions(session_file):
-            if since is not None and _local_date(transition.timestamp) < since:
-                continue
-            all_transitions.append(transition)
+    Reads them from load_session_activity, so logs are parsed in parallel
+    when large and reused from the activity manifest when unchanged. With
+    since, logs last modified before it are skipped without being read.
+    Each log's transitions are already in time order, so they are k-way
+    merged (see merge_by_timestamp) rather than collected and re-sorted.
+    """
+    if session_files is None:
+        session_files = find_session_files(sessions_dir)
+    if since is not None:
+        session_files = filter_files_by_date(session_files, since)
 
-    all_transitions.sort(key=lambda t: t.timestamp)
+    runs = []
+    for _, _, transitions in load_session_activity(sessions_dir, session_files):
+        if since is not None:
+            transitions = [t for t in transitions if _local_date(t.timestamp) >= since]
+        if transitions:
+            runs.append(transitions)
 
-    yield from all_transitions
+    yield from merge_by_timestamp(runs)
 
 
 def write_transitions_json(transitions: list[ModelTransition], output_path: Path):
@@ -1033,7 +2140,7 @@ def write_transitions_json(transitions: list[ModelTransition], output_path: Path
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(data, indent=2))
+    output_path.write_text(dumps_json_pretty(data), encoding='utf-8')
 
 
 def format_transition(transition: ModelTransition) -> str:
@@ -1103,37 +2210,22 @@ def get_transition_stats(transitions: list[ModelTransition]) -> dict:
             'date_range': (None, None),
         }
 
-    models: set[str] = set()
-    providers: set[str] = set()
-    model_counts: dict[str, int] = {}
-    provider_counts: dict[str, int] = {}
-
-    first_date: Optional[date] = None
-    last_date: Optional[date] = None
-
-    for t in transitions:
-        if t.to_model:
-            models.add(t.to_model)
-            model_counts[t.to_model] = model_counts.get(t.to_model, 0) + 1
-
-        if t.provider:
-            providers.add(t.provider)
-            provider_counts[t.provider] = provider_counts.get(t.provider, 0) + 1
+    model_counts = Counter(t.to_model for t in transitions if t.to_model)
+    provider_counts = Counter(t.provider for t in transitions if t.provider)
 
-        trans_date = _local_date(t.timestamp)
-        if first_date is None or trans_date < first_date:
-            first_date = trans_date
-        if last_date is None or trans_date > last_date:
-            last_date = trans_date
+    local_date = local_date_bucketer()
+    trans_dates = [local_date(t.timestamp) for t in transitions]
+    first_date, last_date = min(trans_dates), max(trans_dates)
 
-    most_common = max(model_counts.items(), key=lambda x: x[1])[0] if model_counts else None
+    # most_common keeps the first-seen model on ties, like max() over items()
+    most_common = model_counts.most_common(1)[0][0] if model_counts else None
 
     return {
         'total_transitions': len(transitions),
-        'models_used': sorted(models),
-        'providers_used': sorted(providers),
-        'transitions_by_model': model_counts,
-        'transitions_by_provider': provider_counts,
+        'models_used': sorted(model_counts),
+        'providers_used': sorted(provider_counts),
+        'transitions_by_model': dict(model_counts),
+        'transitions_by_provider': dict(provider_counts),
         'most_common_model': most_common,
         'date_range': (first_date, last_date),
     }
@@ -1143,8 +2235,67 @@ def get_transition_stats(transitions: list[ModelTransition]) -> dict:
 # BACKFILL (simple extraction)
 # =============================================================================
 
+# Extraction patterns, compiled once at import time (these run per message)
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Leading words that mark a user message as a question or request
+_QUESTION_STARTS = (
+    'can', 'could', 'would', 'will', 'how', 'what', 'why', 'when', 'where', 'who',
+    'is', 'are', 'do', 'does',
+    'help', 'explain', 'show', 'tell', 'create', 'make', 'fix', 'implement', 'add',
+    'remove', 'update',
+)
+_QUESTION_PREFIX_LEN = max(len(w) for w in _QUESTION_STARTS) + 1
+
+# Trailing '?', or a leading question word / request verb, in a single scan
+_QUESTION_RE = re.compile(
+    r'\?$|^(?:' + '|'.join(_QUESTION_STARTS) + r')\b',
+    re.IGNORECASE,
+)
+
+_DECISION_RES = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"I(?:'ll| will) ([^.!?]+[.!?])",
+        r"Let(?:'s| us) ([^.!?]+[.!?])",
+        r"I(?:'m going to| am going to) ([^.!?]+[.!?])",
+        r"We should ([^.!?]+[.!?])",
+        r"The (?:solution|fix|answer) is ([^.!?]+[.!?])",
+    )
+]
+
+# Words ignored when picking topics (built once, not per call)
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'again', 'further', 'then', 'once', 'here',
+    'there', 'when', 'where', 'why', 'how', 'all', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+    'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just',
+    'and', 'but', 'if', 'or', 'because', 'until', 'while', 'this',
+    'that', 'these', 'those', 'what', 'which', 'who', 'whom', 'it',
+    'its', 'you', 'your', 'i', 'me', 'my', 'we', 'our', 'they', 'them',
+    'their', 'he', 'she', 'him', 'her', 'his', 'let', 'file', 'files',
+    'please', 'thanks', 'thank', 'yes', 'no', 'okay', 'ok', 'sure',
+})
+
+
+def auto_generated_header_match(content: str) -> Optional[re.Match]:
+    """Find the "*Auto-generated from N session messages*" marker in a memory file.
+
+    Group 1 holds the message count. Returns None for hand-written files.
+    """
+    return AUTO_GENERATED_HEADER_RE.search(content)
+
+
 def extract_preserved_content(existing_content: str) -> Tuple[str, str]:
-    """Extract hand-written content from an existing memory file."""
+    """Extract hand-written content from an existing memory file.
+
+    Splits on the literal AUTO_GENERATED_FOOTER with str.find; keep it that
+    way rather than switching to a regex, since this runs on every --preserve.
+    """
     if not existing_content:
         return "", ""
 
@@ -1153,57 +2304,45 @@ def extract_preserved_content(existing_content: str) -> Tuple[str, str]:
     if footer_pos == -1:
         return "", existing_content
 
-    after_footer = existing_content[footer_pos + len(AUTO_GENERATED_FOOTER):]
-    hand_written = after_footer.lstrip('\n')
-    auto_generated = existing_content[:footer_pos + len(AUTO_GENERATED_FOOTER)]
-
-    return auto_generated, hand_written
+    footer_end = footer_pos + len(AUTO_GENERATED_FOOTER)
+    return existing_content[:footer_end], existing_content[footer_end:].lstrip('\n')
 
 
 def extract_topics(messages: list[Message], max_topics: int = 10) -> list[str]:
     """Extract main topics from messages using simple keyword analysis."""
-    stopwords = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-        'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'as',
-        'into', 'through', 'during', 'before', 'after', 'above', 'below',
-        'between', 'under', 'again', 'further', 'then', 'once', 'here',
-        'there', 'when', 'where', 'why', 'how', 'all', 'each', 'few',
-        'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
-        'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just',
-        'and', 'but', 'if', 'or', 'because', 'until', 'while', 'this',
-        'that', 'these', 'those', 'what', 'which', 'who', 'whom', 'it',
-        'its', 'you', 'your', 'i', 'me', 'my', 'we', 'our', 'they', 'them',
-        'their', 'he', 'she', 'him', 'her', 'his', 'let', 'file', 'files',
-        'please', 'thanks', 'thank', 'yes', 'no', 'okay', 'ok', 'sure',
-    }
-
-    word_counts: dict[str, int] = {}
+    word_counts: Counter[str] = Counter()
     for msg in messages:
         if msg.role != 'user':
             continue
 
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', msg.text_content.lower())
-        for word in words:
-            if word not in stopwords:
-                word_counts[word] = word_counts.get(word, 0) + 1
+        text = msg.text_content
+
+        # Lowercase the short matched tokens rather than copying the whole message
+        words = map(str.lower, _WORD_RE.findall(text))
+        word_counts.update(word for word in words if word not in _STOPWORDS)
 
-    sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-    topics = [word.capitalize() for word, count in sorted_words[:max_topics] if count >= 2]
+    topics = [word.capitalize() for word, count in word_counts.most_common(max_topics) if count >= 2]
 
     return topics
 
 
 def extract_key_exchanges(messages: list[Message], max_exchanges: int = 10) -> list[dict]:
-    """Extract key user questions and responses."""
+    """Extract key user questions and responses.
+
+    Excerpts are not sanitized here; render_daily_template sanitizes the
+    rendered file in a single pass.
+    """
     exchanges = []
+    message_count = len(messages)
 
-    question_patterns = [
-        r'\?$',
-        r'^(can|could|would|will|how|what|why|when|where|who|is|are|do|does)\b',
-        r'^(help|explain|show|tell|create|make|fix|implement|add|remove|update)\b',
-    ]
+    # next_assistant[i] = index of the first assistant message after i (-1 if none),
+    # filled by one right-to-left walk instead of a forward scan per question
+    next_assistant = [-1] * message_count
+    nxt = -1
+    for k in range(message_count - 1, -1, -1):
+        next_assistant[k] = nxt
+        if messages[k].role == 'assistant':
+            nxt = k
 
     for i, msg in enumerate(messages):
         if msg.role != 'user':
@@ -1213,21 +2352,23 @@ def extract_key_exchanges(messages: list[Message], max_exchanges: int = 10) -> l
         if not text:
             continue
 
-        is_question = any(re.search(p, text, re.IGNORECASE) for p in question_patterns)
+        # Cheap prefix test first; the regex only confirms the word boundary
+        # ("is" but not "isolate") for the few messages that pass it
+        is_question = text.endswith('?') or (
+            text[:_QUESTION_PREFIX_LEN].lower().startswith(_QUESTION_STARTS)
+            and _QUESTION_RE.search(text) is not None
+        )
         if not is_question and len(text) < 20:
             continue
 
+        # Only pair with a response within the next four messages
         response_text = ""
-        for j in range(i + 1, min(i + 5, len(messages))):
-            if messages[j].role == 'assistant':
-                response_text = messages[j].text_content.strip()
-                break
+        j = next_assistant[i]
+        if j != -1 and j - i < 5:
+            response_text = messages[j].text_content.strip()
 
         user_excerpt = text[:100] + ('...' if len(text) > 100 else '')
-        user_excerpt = sanitize_content(user_excerpt)
-        
         response_excerpt = response_text[:100] + ('...' if len(response_text) > 100 else '') if response_text else ""
-        response_excerpt = sanitize_content(response_excerpt)
 
         exchanges.append({
             'time': msg.timestamp.strftime('%H:%M'),
@@ -1242,46 +2383,43 @@ def extract_key_exchanges(messages: list[Message], max_exchanges: int = 10) -> l
 
 
 def extract_decisions(messages: list[Message], max_decisions: int = 10) -> list[str]:
-    """Extract decisions and action items from assistant messages."""
-    decision_patterns = [
-        r"I(?:'ll| will) ([^.!?]+[.!?])",
-        r"Let(?:'s| us) ([^.!?]+[.!?])",
-        r"I(?:'m going to| am going to) ([^.!?]+[.!?])",
-        r"We should ([^.!?]+[.!?])",
-        r"The (?:solution|fix|answer) is ([^.!?]+[.!?])",
-    ]
+    """Extract decisions and action items from assistant messages.
 
+    Decisions are not sanitized here; see render_daily_template.
+    """
     decisions = []
+    # Lowercased keys of decisions already taken; a single add() both tests and
+    # records membership, and dedup happens inline so early exits count unique items
+    seen: set[str] = set()
 
     for msg in messages:
+        if len(decisions) >= max_decisions:
+            break
+
         if msg.role != 'assistant':
             continue
 
         text = msg.text_content
 
-        for pattern in decision_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                decision = match.strip()
+        for pattern in _DECISION_RES:
+            # finditer lets us stop mid-message instead of materializing every match
+            for match in pattern.finditer(text):
+                decision = match.group(1).strip()
                 if len(decision) > 10 and len(decision) < 200:
-                    decision = sanitize_content(decision)
-                    decisions.append(decision)
+                    seen_count = len(seen)
+                    seen.add(decision.lower())
+                    if len(seen) != seen_count:
+                        decisions.append(decision)
+                        if len(decisions) >= max_decisions:
+                            break
+            if len(decisions) >= max_decisions:
+                break
 
-        if msg.has_tool_calls:
+        if len(decisions) < max_decisions and msg.has_tool_calls and 'executed tool/command' not in seen:
+            seen.add('executed tool/command')
             decisions.append("Executed tool/command")
 
-        if len(decisions) >= max_decisions:
-            break
-
-    seen = set()
-    unique_decisions = []
-    for d in decisions:
-        d_lower = d.lower()
-        if d_lower not in seen:
-            seen.add(d_lower)
-            unique_decisions.append(d)
-
-    return unique_decisions[:max_decisions]
+    return decisions
 
 
 def format_transitions_for_template(transitions: list[ModelTransition]) -> list[dict]:
@@ -1301,49 +2439,44 @@ def format_transitions_for_template(transitions: list[ModelTransition]) -> list[
 
 
 def render_daily_template(context: dict) -> str:
-    """Render daily memory file content from context dict."""
-    lines = []
+    """Render daily memory file content from context dict.
 
-    lines.append(f"# {context['date']} ({context['day_name']})")
-    lines.append("")
-    lines.append(f"*Auto-generated from {context['message_count']} session messages*")
-    lines.append("")
+    The returned content is already sanitized.
+    """
+    parts = [
+        f"# {context['date']} ({context['day_name']})\n\n"
+        f"*Auto-generated from {context['message_count']} session messages*\n\n"
+    ]
 
     if context.get('compaction_summary'):
-        lines.append("## Context Summary")
-        sanitized_summary = sanitize_content(context['compaction_summary'])
-        lines.append(sanitized_summary)
-        lines.append("")
+        parts.append(f"## Context Summary\n{context['compaction_summary']}\n\n")
 
     if context.get('topics'):
-        lines.append("## Topics Covered")
-        for topic in context['topics']:
-            lines.append(f"- {topic}")
-        lines.append("")
+        items = '\n'.join(f"- {topic}" for topic in context['topics'])
+        parts.append(f"## Topics Covered\n{items}\n\n")
 
     if context.get('key_exchanges'):
-        lines.append("## Key Exchanges")
-        for exchange in context['key_exchanges']:
-            lines.append(f"- [{exchange['time']}] {exchange['user_excerpt']}")
-        lines.append("")
+        items = '\n'.join(f"- [{exchange['time']}] {exchange['user_excerpt']}" for exchange in context['key_exchanges'])
+        parts.append(f"## Key Exchanges\n{items}\n\n")
 
     if context.get('decisions'):
-        lines.append("## Decisions/Actions")
-        for decision in context['decisions']:
-            lines.append(f"- {decision}")
-        lines.append("")
+        items = '\n'.join(f"- {decision}" for decision in context['decisions'])
+        parts.append(f"## Decisions/Actions\n{items}\n\n")
 
     if context.get('transitions'):
-        lines.append("## Model Transitions")
-        for trans in context['transitions']:
-            lines.append(f"- {trans['time']}: {trans['from']} -> {trans['to']}")
-        lines.append("")
+        items = '\n'.join(f"- {trans['time']}: {trans['from']} -> {trans['to']}" for trans in context['transitions'])
+        parts.append(f"## Model Transitions\n{items}\n\n")
 
-    lines.append("---")
-    lines.append("")
-    lines.append("*Review and edit this draft to capture what's actually important.*")
+    parts.append(f"---\n\n{AUTO_GENERATED_FOOTER}")
 
-    return '\n'.join(lines)
+    # One sanitize pass over the whole file instead of one per excerpt/decision
+    return sanitize_content(''.join(parts))
+
+
+def write_memory_file(output_path: Path, content: str):
+    """Write final (already sanitized) memory content through a single buffered handle."""
+    with output_path.open('w', encoding='utf-8', buffering=MEMORY_WRITE_BUFFER_SIZE) as f:
+        f.write(content)
 
 
 def generate_daily_memory(
@@ -1351,9 +2484,18 @@ def generate_daily_memory(
     sessions_dir: Path,
     output_path: Path,
     force: bool = False,
-    preserve: bool = False
+    preserve: bool = False,
+    day_records: Optional[DayRecords] = None,
+    ensure_dir: bool = True,
+    session_files: Optional[list[Path]] = None
 ) -> str:
-    """Generate a daily memory file from session logs."""
+    """Generate a daily memory file from session logs.
+
+    If day_records is given (e.g. a slice of build_session_index), the
+    sessions directory is not scanned. Batch callers that already created
+    the output directory pass ensure_dir=False to skip the per-file mkdir,
+    and may pass a pre-listed session_files to skip find_session_files.
+    """
     existing_content = ""
     if output_path.exists():
         if not force and not preserve:
@@ -1361,29 +2503,36 @@ def generate_daily_memory(
         if preserve:
             existing_content = output_path.read_text()
 
-    messages: list[Message] = []
-    transitions: list[ModelTransition] = []
+    message_runs: list[list[Message]] = []
+    transition_runs: list[list[ModelTransition]] = []
     compaction_summary: Optional[str] = None
 
-    for session_file in find_session_files(sessions_dir):
-        for msg in get_messages(session_file, date_filter=log_date):
-            messages.append(msg)
+    if day_records is not None:
+        message_runs.append(day_records.messages)
+        transition_runs.append(day_records.transitions)
+        compaction_summary = day_records.compaction_summary
+    else:
+        # Logs untouched since before the day are dropped without being opened
+        if session_files is None:
+            session_files = find_session_files_for_date(sessions_dir, log_date)
+        else:
+            session_files = filter_files_by_date(session_files, log_date)
 
-        for trans in get_model_transitions(session_file):
-            if _local_date(trans.timestamp) == log_date:
-                transitions.append(trans)
+        for session_file in session_files:
+            scan = scan_session_file(session_file, date_filter=log_date)
+            message_runs.append(scan.messages)
+            transition_runs.append(scan.transitions)
 
-        for comp in get_compactions(session_file):
-            if comp['timestamp'] and _local_date(comp['timestamp']) == log_date:
+            for comp in scan.compactions:
                 if comp.get('summary'):
                     compaction_summary = comp['summary']
 
+    messages = merge_by_timestamp(message_runs)
+    transitions = merge_by_timestamp(transition_runs)
+
     if not messages:
         raise ValueError(f"No messages found for {log_date}")
 
-    messages.sort(key=lambda m: m.timestamp)
-    transitions.sort(key=lambda t: t.timestamp)
-
     topics = extract_topics(messages)
     key_exchanges = extract_key_exchanges(messages)
     decisions = extract_decisions(messages)
@@ -1423,8 +2572,9 @@ def generate_daily_memory(
         
         print("Content sanitized successfully.", file=sys.stderr)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content)
+    if ensure_dir:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    write_memory_file(output_path, content)
 
     return str(output_path)
 
@@ -1434,43 +2584,94 @@ def backfill_all_missing(
     memory_dir: Path,
     dry_run: bool = False,
     force: bool = False,
-    preserve: bool = False
+    preserve: bool = False,
+    max_workers: Optional[int] = None,
+    skip_dates: Optional[set[date]] = None,
+    on_result: Optional[Callable[..., None]] = None
 ) -> dict:
-    """Backfill all missing daily memory files."""
+    """Backfill all missing daily memory files.
+
+    Dates are independent, so they are generated in a process pool
+    (max_workers defaults to the CPU count; 1 runs serially in-process).
+
+    skip_dates (e.g. from load_checkpoint) are left out; on_result is called
+    as on_result(log_date, 'created', path) or on_result(log_date, 'error')
+    for each date as its result is collected.
+    """
     gaps = find_gaps(sessions_dir, memory_dir)
 
     created = []
     skipped = []
     errors = []
 
-    for gap in gaps['missing_days']:
-        output_path = memory_dir / f"{gap.date}.md"
+    jobs: list[tuple[date, Path, bool]] = [
+        (gap.date, memory_dir / f"{gap.date}.md", force) for gap in gaps['missing_days']
+    ]
+    if force:
+        jobs.extend((gap.date, memory_dir / f"{gap.date}.md", True) for gap in gaps['sparse_days'])
+    if skip_dates:
+        jobs = [job for job in jobs if job[0] not in skip_dates]
 
-        if dry_run:
-            created.append(str(output_path))
-            continue
+    if dry_run:
+        created = [str(output_path) for _, output_path, _ in jobs]
+        return {
+            'created': created,
+            'skipped': skipped,
+            'errors': errors,
+            'dry_run': dry_run,
+        }
 
-        try:
-            path = generate_daily_memory(gap.date, sessions_dir, output_path, force=force, preserve=preserve)
-            created.append(path)
-        except FileExistsError:
-            skipped.append(gap.date)
-        except Exception as e:
-            errors.append((gap.date, str(e)))
+    # Parse every session file once; each job then only carries its own day
+    index = build_session_index(sessions_dir, find_session_files(sessions_dir)) if jobs else {}
 
-    if force:
-        for gap in gaps['sparse_days']:
-            output_path = memory_dir / f"{gap.date}.md"
+    # All outputs share memory_dir, so create it once rather than per date
+    if jobs:
+        memory_dir.mkdir(parents=True, exist_ok=True)
 
-            if dry_run:
-                created.append(str(output_path))
-                continue
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = min(max_workers, len(jobs))
+
+    executor = None
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        if executor is not None:
+            pending = [
+                executor.submit(
+                    generate_daily_memory, log_date, sessions_dir, output_path,
+                    force=job_force, preserve=preserve,
+                    day_records=index.get(log_date, DayRecords()), ensure_dir=False
+                ).result
+                for log_date, output_path, job_force in jobs
+            ]
+        else:
+            pending = [
+                partial(
+                    generate_daily_memory, log_date, sessions_dir, output_path,
+                    force=job_force, preserve=preserve,
+                    day_records=index.get(log_date, DayRecords()), ensure_dir=False
+                )
+                for log_date, output_path, job_force in jobs
+            ]
 
+        # Collect in gap order so results are deterministic regardless of completion order
+        for (log_date, _, _), get_result in zip(jobs, pending):
             try:
-                path = generate_daily_memory(gap.date, sessions_dir, output_path, force=True, preserve=preserve)
+                path = get_result()
                 created.append(path)
+                if on_result is not None:
+                    on_result(log_date, 'created', path)
+            except FileExistsError:
+                skipped.append(log_date)
             except Exception as e:
-                errors.append((gap.date, str(e)))
+                errors.append((log_date, str(e)))
+                if on_result is not None:
+                    on_result(log_date, 'error')
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return {
         'created': created,
@@ -1520,11 +2721,13 @@ def prepare_conversation_text(messages: list[Message], max_chars: int = 100000)
     for msg in messages:
         sanitized_content = sanitize_content(msg.text_content)
         
-        time_str = msg.timestamp.strftime('%H:%M')
-        role = msg.role.upper()
+        # '%02d' on the fields is several times cheaper than strftime('%H:%M')
+        timestamp = msg.timestamp
         model_str = f" [{msg.model}]" if msg.model else ""
         
-        line = f"[{time_str}] {role}{model_str}: {sanitized_content[:500]}"
+        line = '[%02d:%02d] %s%s: %s' % (
+            timestamp.hour, timestamp.minute, msg.role.upper(), model_str, sanitized_content[:500],
+        )
         
         if total_chars + len(line) > max_chars:
             break
@@ -1704,87 +2907,393 @@ def get_summarizer(backend: str):
     def openai_summarizer(log_date, messages, transitions, existing_content=None, model=None):
         return summarize_with_openai_package(log_date, messages, transitions, existing_content, model, provider="openai")
     
-    def anthropic_summarizer(log_date, messages, transitions, existing_content=None, model=None):
-        return summarize_with_openai_package(log_date, messages, transitions, existing_content, model, provider="anthropic")
+    def anthropic_summarizer(log_date, messages, transitions, existing_content=None, model=None):
+        return summarize_with_openai_package(log_date, messages, transitions, existing_content, model, provider="anthropic")
+    
+    backends = {
+        'openclaw': openclaw_summarizer,
+        'openai': openai_summarizer,
+        'anthropic': anthropic_summarizer,
+    }
+    
+    if backend not in backends:
+        raise ValueError(f"Unknown summarization backend: {backend}. Choose from: {list(backends.keys())}")
+    
+    return backends[backend]
+
+
+def summarize_with_anthropic(
+    log_date: date,
+    messages: list[Message],
+    transitions: list[ModelTransition],
+    existing_content: Optional[str] = None,
+    model: Optional[str] = None
+) -> str:
+    """Summarize a day's conversation using Anthropic API."""
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError(
+            "anthropic package not installed. "
+            "Install with: pip install anthropic"
+        )
+    
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise ValueError(
+            "ANTHROPIC_API_KEY environment variable not set. "
+            "Set it with: export ANTHROPIC_API_KEY=sk-ant-..."
+        )
+    
+    client = anthropic.Anthropic(api_key=api_key)
+    
+    # Use default model if not specified
+    if model is None:
+        model = DEFAULT_SUMMARIZE_MODEL
+    
+    conversation_text = prepare_conversation_text(messages)
+    transitions_note = format_transitions_note(transitions)
+    
+    day_name = log_date.strftime('%A, %Y-%m-%d')
+    
+    user_prompt = f"""Generate a daily memory summary for {day_name}.
+
+Conversation log:
+{conversation_text}
+{transitions_note}
+
+Requirements:
+- Be *detailed* and high-signal (this is the canonical record for the day).
+- Extract concrete decisions, outcomes, and operational changes.
+- If there were many messages/tool calls, include a richer bullet list and a short “what changed” section.
+- Do NOT include secrets or raw PII.
+
+Write in clear narrative + structured bullets."""
+    
+    if existing_content:
+        _, hand_written = extract_preserved_content(existing_content)
+        if hand_written:
+            user_prompt += f"\n\nExisting hand-written notes (PRESERVE AND INCORPORATE):\n{hand_written}"
+    
+    response = client.messages.create(
+        model=model,
+        max_tokens=3500,
+        system=MEMORY_SYSTEM_PROMPT,
+        messages=[{
+            "role": "user",
+            "content": user_prompt
+        }]
+    )
+    
+    summary = response.content[0].text
+    
+    return sanitize_content(summary)
+
+
+def summarize_batch_with_anthropic(
+    prompts: dict[str, str],
+    model: Optional[str] = None,
+    poll_seconds: float = ANTHROPIC_BATCH_POLL_SECONDS,
+    batch_id: Optional[str] = None,
+    on_created: Optional[Callable[[str], None]] = None
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Summarize many prompts in one Anthropic Message Batch.
+    
+    prompts maps custom_id -> user prompt (built by _build_summarization_prompt).
+    Blocks, polling every poll_seconds, until the batch has ended. Batches are
+    billed at half the per-token price but may take minutes to hours.
+    
+    on_created(batch_id) is called as soon as the batch is submitted, so the
+    caller can report or record the id. Passing batch_id instead resumes an
+    already-submitted batch (its custom_ids must match prompts) without
+    creating a new one. Failed status/results requests are retried, up to
+    ANTHROPIC_BATCH_MAX_POLL_ERRORS in a row; then RuntimeError names the
+    batch id to resume from.
+    
+    Returns (summaries, errors): custom_id -> sanitized summary for requests
+    that succeeded, and custom_id -> reason for the rest.
+    """
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError(
+            "anthropic package not installed. "
+            "Install with: pip install anthropic"
+        )
+    
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise ValueError(
+            "ANTHROPIC_API_KEY environment variable not set. "
+            "Set it with: export ANTHROPIC_API_KEY=sk-ant-..."
+        )
+    
+    client = anthropic.Anthropic(api_key=api_key)
+    
+    if batch_id is None:
+        batch = client.messages.batches.create(requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model or DEFAULT_SUMMARIZE_MODEL,
+                    "max_tokens": 3500,
+                    "system": MEMORY_SYSTEM_PROMPT,
+                    "messages": [{"role": "user", "content": user_prompt}],
+                },
+            }
+            for custom_id, user_prompt in prompts.items()
+        ])
+        batch_id = batch.id
+        if on_created is not None:
+            on_created(batch_id)
+        status = batch.processing_status
+    else:
+        status = None
+    
+    def with_retries(request):
+        # The batch keeps running server-side, so a dropped connection or 5xx
+        # while waiting shouldn't abandon it
+        failures = 0
+        while True:
+            try:
+                return request()
+            except Exception as e:
+                failures += 1
+                if failures >= ANTHROPIC_BATCH_MAX_POLL_ERRORS:
+                    raise RuntimeError(
+                        f"Giving up on Anthropic batch {batch_id} after {failures} failed requests ({e}); "
+                        f"it may still finish server-side, so resume it by id"
+                    ) from e
+                print(f"Warning: batch {batch_id} request failed ({e}); retrying", file=sys.stderr)
+                time.sleep(poll_seconds)
+    
+    while status != "ended":
+        if status is not None:
+            time.sleep(poll_seconds)
+        status = with_retries(lambda: client.messages.batches.retrieve(batch_id)).processing_status
+    
+    summaries = {}
+    errors = {}
+    for entry in with_retries(lambda: list(client.messages.batches.results(batch_id))):
+        if entry.result.type == "succeeded":
+            summaries[entry.custom_id] = sanitize_content(entry.result.message.content[0].text)
+        else:
+            errors[entry.custom_id] = str(getattr(entry.result, 'error', None) or entry.result.type)
+    
+    return summaries, errors
+
+
+def llm_cache_key(*parts: str) -> str:
+    """SHA-256 hex digest over the given strings (NUL-separated)."""
+    import hashlib
+
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def read_llm_cache(key: str, cache_dir: Optional[Path]) -> Optional[str]:
+    """Return the cached LLM response for key, or None on a miss.
+
+    Best-effort: an unreadable or undecodable entry is treated as a miss.
+    """
+    if cache_dir is None:
+        return None
+    try:
+        return (cache_dir / f"{key}.md").read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_llm_cache(key: str, response: str, cache_dir: Optional[Path]):
+    """Store an LLM response under key (atomically; no-op when cache_dir is None).
+
+    Best-effort like _write_manifest: a failed write (full disk, bad cache
+    path) is dropped rather than losing the response it was caching. The tmp
+    name is unique per process and thread.
+    """
+    if cache_dir is None:
+        return
+    import threading
+
+    cache_path = cache_dir / f"{key}.md"
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(response, encoding='utf-8')
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        print(f"Warning: could not write LLM cache entry {cache_path} ({e})", file=sys.stderr)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def get_or_generate(key: str, generate: Callable[[], str], cache_dir: Optional[Path]) -> str:
+    """Return the cached LLM response for key, or call generate() and cache it.
+
+    Responses live at <cache_dir>/<key>.md. Keys hash the full prompt, so any
+    change in the day's logs, prompt template, backend or model is a miss;
+    there is no expiry. With cache_dir=None this is just generate().
+    """
+    cached = read_llm_cache(key, cache_dir)
+    if cached is not None:
+        return cached
+
+    result = generate()
+    write_llm_cache(key, result, cache_dir)
+
+    return result
+
+
+def load_day_messages(
+    log_date: date,
+    sessions_dir: Path,
+    session_files: Optional[list[Path]] = None
+) -> tuple[list[Message], list[ModelTransition]]:
+    """All messages and model transitions for a day, merged across sessions in time order."""
+    message_runs: list[list[Message]] = []
+    transition_runs: list[list[ModelTransition]] = []
+    
+    # Logs untouched since before the day are dropped without being opened
+    if session_files is None:
+        session_files = find_session_files_for_date(sessions_dir, log_date)
+    else:
+        session_files = filter_files_by_date(session_files, log_date)
+    
+    for session_file in session_files:
+        scan = scan_session_file(session_file, date_filter=log_date)
+        message_runs.append(scan.messages)
+        transition_runs.append(scan.transitions)
+    
+    return merge_by_timestamp(message_runs), merge_by_timestamp(transition_runs)
+
+
+def format_summarized_memory(log_date: date, message_count: int, summary: str) -> str:
+    """Wrap an LLM summary in the memory file layout and check it for secrets.
+    
+    Raises ValueError if secrets remain after sanitization.
+    """
+    lines = []
+    lines.append(f"# {log_date} ({log_date.strftime('%A')})")
+    lines.append("")
+    lines.append(f"*Auto-generated from {message_count} session messages*")
+    lines.append("")
+    lines.append(summary)
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("*Review and edit this draft to capture what's actually important.*")
+    
+    return _check_summarized_secrets('\n'.join(lines))
+
+
+def _check_summarized_secrets(content: str) -> str:
+    """Return summarized memory content that passes validate_no_secrets.
     
-    backends = {
-        'openclaw': openclaw_summarizer,
-        'openai': openai_summarizer,
-        'anthropic': anthropic_summarizer,
-    }
+    Content with violations is sanitized once; raises ValueError if secrets
+    remain after that.
+    """
+    is_valid, violations = validate_no_secrets(content)
     
-    if backend not in backends:
-        raise ValueError(f"Unknown summarization backend: {backend}. Choose from: {list(backends.keys())}")
+    if not is_valid:
+        print(f"Warning: LLM output contains potential secrets: {violations}", file=sys.stderr)
+        print("Attempting to sanitize...", file=sys.stderr)
+        
+        content = sanitize_content(content)
+        
+        is_valid, violations = validate_no_secrets(content)
+        
+        if not is_valid:
+            raise ValueError(
+                f"Memory file still contains secrets after sanitization: {violations}. "
+                "Refusing to write file."
+            )
+        
+        print("Content sanitized successfully.", file=sys.stderr)
     
-    return backends[backend]
+    return content
 
 
-def summarize_with_anthropic(
+def render_summarized_memory(
     log_date: date,
-    messages: list[Message],
-    transitions: list[ModelTransition],
+    sessions_dir: Path,
     existing_content: Optional[str] = None,
-    model: Optional[str] = None
+    model: Optional[str] = None,
+    backend: str = 'openclaw',
+    session_files: Optional[list[Path]] = None,
+    cache_dir: Optional[Path] = None
 ) -> str:
-    """Summarize a day's conversation using Anthropic API."""
-    try:
-        import anthropic
-    except ImportError:
-        raise ImportError(
-            "anthropic package not installed. "
-            "Install with: pip install anthropic"
-        )
-    
-    api_key = os.environ.get('ANTHROPIC_API_KEY')
-    if not api_key:
-        raise ValueError(
-            "ANTHROPIC_API_KEY environment variable not set. "
-            "Set it with: export ANTHROPIC_API_KEY=sk-ant-..."
-        )
+    """Build the LLM-summarized memory file content for a day, without writing it.
     
-    client = anthropic.Anthropic(api_key=api_key)
+    existing_content, if given, is an existing memory file whose hand-written
+    notes are passed to the LLM to preserve. Other arguments are as for
+    generate_summarized_memory.
     
-    # Use default model if not specified
-    if model is None:
-        model = DEFAULT_SUMMARIZE_MODEL
+    With a cache_dir, the rendered file is also cached under a fingerprint of
+    the day's candidate session files (path, mtime, size), so re-running an
+    unchanged day returns without parsing any logs. The key also covers
+    RENDER_CACHE_VERSION and SECRET_PATTERNS, and a cached file is checked
+    for secrets again before it is returned.
+    """
+    if session_files is None:
+        session_files = find_session_files(sessions_dir)
+    day_files = filter_files_by_date(session_files, log_date)
     
-    conversation_text = prepare_conversation_text(messages)
-    transitions_note = format_transitions_note(transitions)
+    source_key = None
+    if cache_dir is not None:
+        fingerprint = []
+        for f in day_files:
+            st = f.stat()
+            fingerprint.append(f"{f}\t{st.st_mtime_ns}\t{st.st_size}")
+        source_key = llm_cache_key(
+            'rendered', str(RENDER_CACHE_VERSION), repr(SECRET_PATTERNS),
+            str(log_date), backend, model or '', MEMORY_SYSTEM_PROMPT,
+            existing_content or '', *fingerprint
+        )
+        rendered = read_llm_cache(source_key, cache_dir)
+        if rendered is not None:
+            return _check_summarized_secrets(rendered)
     
-    day_name = log_date.strftime('%A, %Y-%m-%d')
+    messages, transitions = load_day_messages(log_date, sessions_dir, day_files)
     
-    user_prompt = f"""Generate a daily memory summary for {day_name}.
-
-Conversation log:
-{conversation_text}
-{transitions_note}
-
-Requirements:
-- Be *detailed* and high-signal (this is the canonical record for the day).
-- Extract concrete decisions, outcomes, and operational changes.
-- If there were many messages/tool calls, include a richer bullet list and a short “what changed” section.
-- Do NOT include secrets or raw PII.
-
-Write in clear narrative + structured bullets."""
+    if not messages:
+        raise ValueError(f"No messages found for {log_date}")
     
-    if existing_content:
-        _, hand_written = extract_preserved_content(existing_content)
-        if hand_written:
-            user_prompt += f"\n\nExisting hand-written notes (PRESERVE AND INCORPORATE):\n{hand_written}"
+    # Get the appropriate summarizer based on backend
+    summarizer = get_summarizer(backend)
+    prompt_existing = existing_content or None
     
-    response = client.messages.create(
-        model=model,
-        max_tokens=3500,
-        system=MEMORY_SYSTEM_PROMPT,
-        messages=[{
-            "role": "user",
-            "content": user_prompt
-        }]
+    cache_key = llm_cache_key(
+        backend, model or '', MEMORY_SYSTEM_PROMPT,
+        _build_summarization_prompt(log_date, messages, transitions, prompt_existing)
     )
     
-    summary = response.content[0].text
+    try:
+        summary = get_or_generate(
+            cache_key,
+            lambda: summarizer(
+                log_date, messages, transitions,
+                existing_content=prompt_existing,
+                model=model
+            ),
+            cache_dir
+        )
+    except Exception as e:
+        # If openclaw backend fails, provide helpful error message
+        if backend == 'openclaw':
+            print(f"Warning: OpenClaw summarization failed ({e})", file=sys.stderr)
+            print("Try using --summarize-backend=anthropic (recommended) or --summarize-backend=openai", file=sys.stderr)
+        raise
     
-    return sanitize_content(summary)
+    content = format_summarized_memory(log_date, len(messages), summary)
+    if source_key is not None:
+        write_llm_cache(source_key, content, cache_dir)
+    
+    return content
 
 
 def generate_summarized_memory(
@@ -1794,7 +3303,9 @@ def generate_summarized_memory(
     force: bool = False,
     preserve: bool = False,
     model: Optional[str] = None,
-    backend: str = 'openclaw'
+    backend: str = 'openclaw',
+    session_files: Optional[list[Path]] = None,
+    cache_dir: Optional[Path] = None
 ) -> str:
     """Generate a daily memory file using LLM summarization.
     
@@ -1806,6 +3317,8 @@ def generate_summarized_memory(
         preserve: Preserve hand-written content from existing files
         model: Model override for summarization
         backend: Summarization backend ('openclaw', 'openai', or 'anthropic')
+        session_files: Pre-listed session files (default: find_session_files(sessions_dir))
+        cache_dir: LLM response cache directory (default: no caching)
     """
     existing_content = ""
     if output_path.exists():
@@ -1814,74 +3327,99 @@ def generate_summarized_memory(
         if preserve:
             existing_content = output_path.read_text()
     
-    messages: list[Message] = []
-    transitions: list[ModelTransition] = []
-    
-    for session_file in find_session_files(sessions_dir):
-        for msg in get_messages(session_file, date_filter=log_date):
-            messages.append(msg)
-        
-        for trans in get_model_transitions(session_file):
-            if _local_date(trans.timestamp) == log_date:
-                transitions.append(trans)
-    
-    if not messages:
-        raise ValueError(f"No messages found for {log_date}")
+    content = render_summarized_memory(
+        log_date, sessions_dir,
+        existing_content=existing_content if preserve else None,
+        model=model, backend=backend, session_files=session_files, cache_dir=cache_dir
+    )
     
-    messages.sort(key=lambda m: m.timestamp)
-    transitions.sort(key=lambda t: t.timestamp)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    write_memory_file(output_path, content)
     
-    # Get the appropriate summarizer based on backend
-    summarizer = get_summarizer(backend)
+    return str(output_path)
+
+
+def backfill_summarized_batch(
+    dates: list[date],
+    sessions_dir: Path,
+    memory_dir: Path,
+    preserve: bool = False,
+    model: Optional[str] = None,
+    session_files: Optional[list[Path]] = None,
+    cache_dir: Optional[Path] = None,
+    batch_id: Optional[str] = None,
+    on_batch_created: Optional[Callable[[str], None]] = None
+) -> dict:
+    """Summarize and (over)write memory files for many dates with one Anthropic batch.
     
-    try:
-        summary = summarizer(
-            log_date, messages, transitions,
-            existing_content=existing_content if preserve else None,
-            model=model
-        )
-    except Exception as e:
-        # If openclaw backend fails, provide helpful error message
-        if backend == 'openclaw':
-            print(f"Warning: OpenClaw summarization failed ({e})", file=sys.stderr)
-            print("Try using --summarize-backend=anthropic (recommended) or --summarize-backend=openai", file=sys.stderr)
-        raise
+    Days already in the LLM cache are written straight away; the rest are
+    submitted together via summarize_batch_with_anthropic. Cache keys match
+    the 'anthropic' backend, so either path reuses the other's responses.
+    batch_id and on_batch_created are passed through to resume an earlier
+    batch or learn a new one's id. A day that fails to write is reported in
+    'errors' without stopping the others.
     
-    lines = []
-    lines.append(f"# {log_date} ({log_date.strftime('%A')})")
-    lines.append("")
-    lines.append(f"*Auto-generated from {len(messages)} session messages*")
-    lines.append("")
-    lines.append(summary)
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append("*Review and edit this draft to capture what's actually important.*")
+    Returns:
+        Dict with 'created' (paths) and 'errors' ((date, reason) tuples)
+    """
+    created = []
+    errors = []
+    pending = {}  # custom_id -> (log_date, output_path, message count, cache key)
+    prompts = {}
     
-    content = '\n'.join(lines)
+    if session_files is None:
+        session_files = find_session_files(sessions_dir)
+    memory_dir.mkdir(parents=True, exist_ok=True)
     
-    is_valid, violations = validate_no_secrets(content)
+    def write_day(log_date, output_path, message_count, summary):
+        try:
+            content = format_summarized_memory(log_date, message_count, summary)
+            write_memory_file(output_path, content)
+        except (ValueError, OSError) as e:
+            errors.append((log_date, str(e)))
+            return
+        created.append(str(output_path))
     
-    if not is_valid:
-        print(f"Warning: LLM output contains potential secrets: {violations}", file=sys.stderr)
-        print("Attempting to sanitize...", file=sys.stderr)
-        
-        content = sanitize_content(content)
+    for log_date in dates:
+        output_path = memory_dir / f"{log_date}.md"
+        existing_content = None
+        if preserve and output_path.exists():
+            existing_content = output_path.read_text() or None
         
-        is_valid, violations = validate_no_secrets(content)
+        messages, transitions = load_day_messages(log_date, sessions_dir, session_files)
+        if not messages:
+            errors.append((log_date, f"No messages found for {log_date}"))
+            continue
         
-        if not is_valid:
-            raise ValueError(
-                f"Memory file still contains secrets after sanitization: {violations}. "
-                "Refusing to write file."
-            )
+        user_prompt = _build_summarization_prompt(log_date, messages, transitions, existing_content)
+        cache_key = llm_cache_key('anthropic', model or '', MEMORY_SYSTEM_PROMPT, user_prompt)
         
-        print("Content sanitized successfully.", file=sys.stderr)
+        cached = read_llm_cache(cache_key, cache_dir)
+        if cached is not None:
+            write_day(log_date, output_path, len(messages), cached)
+        else:
+            custom_id = str(log_date)
+            pending[custom_id] = (log_date, output_path, len(messages), cache_key)
+            prompts[custom_id] = user_prompt
     
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content)
+    if prompts:
+        summaries, batch_errors = summarize_batch_with_anthropic(
+            prompts, model=model, batch_id=batch_id, on_created=on_batch_created
+        )
+        
+        for custom_id, (log_date, output_path, message_count, cache_key) in pending.items():
+            summary = summaries.get(custom_id)
+            if summary is None:
+                errors.append((log_date, batch_errors.get(custom_id, "no result in batch")))
+                continue
+            try:
+                write_llm_cache(cache_key, summary, cache_dir)
+                write_day(log_date, output_path, message_count, summary)
+            except Exception as e:
+                # The batch is already paid for; one bad day mustn't drop the rest
+                errors.append((log_date, str(e)))
     
-    return str(output_path)
+    return {'created': created, 'errors': errors}
 
 
 # =============================================================================
@@ -1894,7 +3432,11 @@ def validate_memory_files(memory_dir: Path, sessions_dir: Path) -> dict:
     valid_count = 0
     total_count = 0
 
-    if not memory_dir.exists():
+    # One listing; DirEntry.stat() below reuses it instead of exists() + glob + stat()
+    try:
+        with os.scandir(memory_dir) as entries:
+            md_entries = [e for e in entries if e.name.endswith('.md')]
+    except (FileNotFoundError, NotADirectoryError):
         return {
             'issues': [ValidationIssue(
                 file_path=str(memory_dir),
@@ -1908,7 +3450,8 @@ def validate_memory_files(memory_dir: Path, sessions_dir: Path) -> dict:
 
     daily_activity = collect_daily_activity(sessions_dir) if sessions_dir.exists() else {}
 
-    for file_path in memory_dir.glob('*.md'):
+    for entry in md_entries:
+        file_path = memory_dir / entry.name
         total_count += 1
         file_issues: list[ValidationIssue] = []
 
@@ -1936,7 +3479,7 @@ def validate_memory_files(memory_dir: Path, sessions_dir: Path) -> dict:
                     severity='warning'
                 ))
 
-        file_size = file_path.stat().st_size
+        file_size = entry.stat().st_size
         if file_size < MIN_VALID_SIZE:
             file_issues.append(ValidationIssue(
                 file_path=str(file_path),
@@ -1959,10 +3502,7 @@ def validate_memory_files(memory_dir: Path, sessions_dir: Path) -> dict:
 
 def _validate_filename(file_path: Path) -> date | None:
     """Validate filename matches YYYY-MM-DD.md pattern."""
-    try:
-        return date.fromisoformat(file_path.stem)
-    except ValueError:
-        return None
+    return parse_memory_filename(file_path.name)
 
 
 def _validate_header(file_path: Path, expected_date: date) -> ValidationIssue | None:
@@ -2056,6 +3596,87 @@ def get_default_memory_dir() -> Path:
     return DEFAULT_MEMORY_DIR
 
 
+def get_default_llm_cache_dir() -> Path:
+    return DEFAULT_LLM_CACHE_DIR
+
+
+def get_llm_concurrency() -> int:
+    """Number of concurrent LLM calls, from MEMORY_SYNC_CONCURRENCY if set."""
+    try:
+        return max(1, int(os.environ.get("MEMORY_SYNC_CONCURRENCY", DEFAULT_LLM_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_LLM_CONCURRENCY
+
+
+def iter_concurrent(items: list, fn: Callable) -> Iterator[tuple]:
+    """Run fn(item) for each item on a bounded thread pool.
+
+    LLM calls are network-bound, so up to get_llm_concurrency() of them run
+    at once; starts are spaced by LLM_BATCH_DELAY_SECONDS to stay under API
+    rate limits. Yields (item, future) pairs in completion order, as soon as
+    each finishes: only that many calls are ever submitted, and results that
+    arrive while the next start is being held back are yielded meanwhile.
+    If the consumer stops early, calls not yet started are cancelled.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    workers = min(get_llm_concurrency(), len(items))
+    if workers < 1:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending: dict = {}
+    next_start = time.monotonic()
+    try:
+        for item in items:
+            # Wait for a free slot and the pacing delay, yielding what finishes
+            while len(pending) >= workers or time.monotonic() < next_start:
+                timeout = None if len(pending) >= workers else next_start - time.monotonic()
+                if not pending:
+                    time.sleep(max(timeout, 0))
+                    continue
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+
+            pending[executor.submit(fn, item)] = item
+            next_start = time.monotonic() + LLM_BATCH_DELAY_SECONDS
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+class BufferedEcho:
+    """Collects command output and passes it to click.echo in large chunks.
+
+    Call it like click.echo; text is written once OUTPUT_FLUSH_CHARS have
+    accumulated and on flush(), instead of one echo (and write) per line.
+    """
+
+    def __init__(self, err: bool = False):
+        self.err = err
+        self.parts: list[str] = []
+        self.size = 0
+
+    def __call__(self, message: str = "", nl: bool = True):
+        if nl:
+            message += "\n"
+        self.parts.append(message)
+        self.size += len(message)
+        if self.size >= OUTPUT_FLUSH_CHARS:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            click.echo(''.join(self.parts), nl=False, err=self.err)
+            self.parts.clear()
+            self.size = 0
+
+
 def parse_date_str(date_str: str) -> date:
     """Parse a date string in YYYY-MM-DD format."""
     try:
@@ -2114,9 +3735,16 @@ def compare(sessions_dir, memory_dir, include_today):
               default='anthropic',
               help="Backend for LLM summarization (default: anthropic - uses Claude models)")
 @click.option("--model", default=None, help=f"Model override for summarization (default varies by backend)")
+@click.option("--no-cache", "no_cache", is_flag=True, help="Always call the LLM, bypassing the on-disk summary cache")
+@click.option("--batch", "use_batch", is_flag=True,
+              help="With --all --summarize: submit all days as one Anthropic Message Batch (half price, slower)")
+@click.option("--batch-id", "batch_id", default=None,
+              help="With --batch: resume waiting on an already-submitted batch instead of creating one")
+@click.option("--checkpoint", "checkpoint", default=None, type=click.Path(dir_okay=False),
+              help="Record finished dates in this JSONL file and skip them when re-run (multi-date runs)")
 @click.option("--sessions-dir", default=None, help="Path to session logs directory")
 @click.option("--memory-dir", default=None, help="Path to memory files directory")
-def backfill(target_date, backfill_all, today, since_date, until_date, incremental, dry_run, force, preserve, summarize, summarize_backend, model, sessions_dir, memory_dir):
+def backfill(target_date, backfill_all, today, since_date, until_date, incremental, dry_run, force, preserve, summarize, summarize_backend, model, no_cache, use_batch, batch_id, checkpoint, sessions_dir, memory_dir):
     """Generate missing daily memory files from JSONL logs."""
     # Validate mutual exclusivity
     date_flags = [target_date, backfill_all, today, since_date, incremental]
@@ -2130,6 +3758,14 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
         click.echo("Error: Cannot combine --date, --today, --since, --all, and --incremental", err=True)
         sys.exit(1)
 
+    if use_batch and not (backfill_all and summarize and summarize_backend == 'anthropic'):
+        click.echo("Error: --batch requires --all --summarize with the anthropic backend", err=True)
+        sys.exit(1)
+
+    if batch_id and not use_batch:
+        click.echo("Error: --batch-id requires --batch", err=True)
+        sys.exit(1)
+
     sessions_path = Path(sessions_dir) if sessions_dir else get_default_sessions_dir()
     memory_path = Path(memory_dir) if memory_dir else get_default_memory_dir()
 
@@ -2139,17 +3775,32 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
 
     memory_path.mkdir(parents=True, exist_ok=True)
 
+    # List session files once for every date processed below
+    session_files = find_session_files(sessions_path)
+
+    # Resume support: dates a previous (interrupted) run already created
+    checkpoint_path = Path(checkpoint) if checkpoint else None
+    done_dates = load_checkpoint(checkpoint_path) if checkpoint_path else set()
+
+    def record(log_date, status, path=None):
+        if checkpoint_path and not dry_run:
+            append_checkpoint(checkpoint_path, log_date, status, path)
+
     # Choose generator function
     if summarize:
+        cache_dir = None if no_cache else get_default_llm_cache_dir()
+
         def generate_fn(log_date, sessions_dir, output_path, force, preserve=False):
             return generate_summarized_memory(
                 log_date, sessions_dir, output_path, force=force, preserve=preserve,
-                model=model, backend=summarize_backend
+                model=model, backend=summarize_backend, session_files=session_files,
+                cache_dir=cache_dir
             )
     else:
         def generate_fn(log_date, sessions_dir, output_path, force, preserve=False):
             return generate_daily_memory(
-                log_date, sessions_dir, output_path, force=force, preserve=preserve
+                log_date, sessions_dir, output_path, force=force, preserve=preserve,
+                session_files=session_files
             )
 
     # Determine dates to process
@@ -2175,10 +3826,7 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
             click.echo(f"Error: --since date {from_date} is {'in the future' if not until_date else f'after --until date {until_date}'}", err=True)
             sys.exit(1)
         
-        current = from_date
-        while current <= to_date:
-            dates_to_process.append(current)
-            current += timedelta(days=1)
+        dates_to_process = [from_date + timedelta(days=i) for i in range((to_date - from_date).days + 1)]
         
         until_msg = f" (until {until_date}, exclusive)" if until_date else ""
         click.echo(f"Processing dates from {from_date} to {to_date}{until_msg} ({len(dates_to_process)} days)")
@@ -2205,6 +3853,11 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
         dates_to_process = [d for d in dates_to_process if d < until]
         if len(dates_to_process) < original_count:
             click.echo(f"Filtered to dates before {until}: {len(dates_to_process)} days (excluded {original_count - len(dates_to_process)})")
+
+    if done_dates and dates_to_process:
+        original_count = len(dates_to_process)
+        dates_to_process = [d for d in dates_to_process if d not in done_dates]
+        click.echo(f"Resuming from checkpoint: skipping {original_count - len(dates_to_process)} completed days")
     
     # Process specific dates
     if dates_to_process and not backfill_all:
@@ -2212,32 +3865,63 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
         skipped = []
         errors = []
         
-        for log_date in dates_to_process:
-            output_path = memory_path / f"{log_date}.md"
-            
-            if dry_run:
-                click.echo(f"Would create: {output_path}")
-                created.append(str(output_path))
-            else:
+        # Summaries are LLM calls, so several dates run at once
+        if summarize and not dry_run and len(dates_to_process) > 1:
+            click.echo(f"Summarizing {len(dates_to_process)} days "
+                       f"({min(get_llm_concurrency(), len(dates_to_process))} concurrent)...")
+
+            def summarize_date(log_date):
+                output_path = memory_path / f"{log_date}.md"
+                return generate_fn(log_date, sessions_path, output_path, force=force, preserve=preserve)
+
+            for log_date, future in iter_concurrent(dates_to_process, summarize_date):
                 try:
-                    path = generate_fn(log_date, sessions_path, output_path, force=force, preserve=preserve)
+                    path = future.result()
                     created.append(path)
+                    record(log_date, 'created', path)
                     click.echo(f"Created: {path}")
                 except FileExistsError:
                     skipped.append(log_date)
-                    if len(dates_to_process) > 1:
-                        click.echo(f"Skipped: {output_path} (already exists)")
-                    else:
-                        click.echo(f"Error: File already exists: {output_path}", err=True)
-                        click.echo("Use --force or --preserve to overwrite.", err=True)
-                        sys.exit(1)
-                except ValueError as e:
+                    click.echo(f"Skipped: {memory_path / f'{log_date}.md'} (already exists)")
+                except Exception as e:
+                    # One failed API call shouldn't abort the other dates in the pool
                     errors.append((log_date, str(e)))
-                    if len(dates_to_process) > 1:
-                        click.echo(f"Error for {log_date}: {e}", err=True)
-                    else:
-                        click.echo(f"Error: {e}", err=True)
-                        sys.exit(1)
+                    record(log_date, 'error')
+                    click.echo(f"Error for {log_date}: {e}", err=True)
+        else:
+            # Per-date lines are batched into a few writes; flushed before any stderr line
+            out = BufferedEcho()
+            for log_date in dates_to_process:
+                output_path = memory_path / f"{log_date}.md"
+            
+                if dry_run:
+                    out(f"Would create: {output_path}")
+                    created.append(str(output_path))
+                else:
+                    try:
+                        path = generate_fn(log_date, sessions_path, output_path, force=force, preserve=preserve)
+                        created.append(path)
+                        record(log_date, 'created', path)
+                        out(f"Created: {path}")
+                    except FileExistsError:
+                        skipped.append(log_date)
+                        if len(dates_to_process) > 1:
+                            out(f"Skipped: {output_path} (already exists)")
+                        else:
+                            out.flush()
+                            click.echo(f"Error: File already exists: {output_path}", err=True)
+                            click.echo("Use --force or --preserve to overwrite.", err=True)
+                            sys.exit(1)
+                    except ValueError as e:
+                        errors.append((log_date, str(e)))
+                        record(log_date, 'error')
+                        out.flush()
+                        if len(dates_to_process) > 1:
+                            click.echo(f"Error for {log_date}: {e}", err=True)
+                        else:
+                            click.echo(f"Error: {e}", err=True)
+                            sys.exit(1)
+            out.flush()
         
         if len(dates_to_process) > 1:
             click.echo("")
@@ -2262,31 +3946,76 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
     
     elif backfill_all:
         if summarize:
-            gaps = find_gaps(sessions_path, memory_path)
+            gaps = find_gaps(sessions_path, memory_path, session_files=session_files)
             created = []
             errors = []
 
             all_gaps = gaps['missing_days'] + (gaps['sparse_days'] if force else [])
+            if done_dates:
+                all_gaps = [gap for gap in all_gaps if gap.date not in done_dates]
 
             if dry_run:
                 click.echo("Dry run - no files created")
                 for gap in all_gaps:
                     click.echo(f"Would create: {memory_path / f'{gap.date}.md'}")
-            else:
-                for i, gap in enumerate(all_gaps):
-                    output_path = memory_path / f"{gap.date}.md"
-                    click.echo(f"Summarizing {gap.date}...", nl=False)
+            elif all_gaps and use_batch:
+                if batch_id:
+                    click.echo(f"Resuming batch {batch_id} for {len(all_gaps)} days...")
+                else:
+                    click.echo(f"Submitting {len(all_gaps)} days as one batch (this can take a while)...")
+                submitted = [batch_id] if batch_id else []
+
+                def on_batch_created(new_batch_id):
+                    # Printed and checkpointed before polling, so an interrupted
+                    # wait can pick the paid batch back up with --batch-id
+                    submitted.append(new_batch_id)
+                    click.echo(f"Submitted batch {new_batch_id} (if interrupted, rerun with --batch-id {new_batch_id})")
+                    if checkpoint_path:
+                        append_checkpoint_batch(checkpoint_path, new_batch_id)
+
+                try:
+                    result = backfill_summarized_batch(
+                        [gap.date for gap in all_gaps], sessions_path, memory_path,
+                        preserve=preserve, model=model, session_files=session_files,
+                        cache_dir=cache_dir, batch_id=batch_id, on_batch_created=on_batch_created
+                    )
+                except (ImportError, ValueError, RuntimeError) as e:
+                    click.echo(f"Error: {e}", err=True)
+                    if submitted:
+                        click.echo(f"Resume with: --batch-id {submitted[0]}", err=True)
+                    sys.exit(1)
+                except KeyboardInterrupt:
+                    if submitted:
+                        click.echo(f"\nInterrupted; batch {submitted[0]} keeps running. "
+                                   f"Resume with: --batch-id {submitted[0]}", err=True)
+                    raise
+                created = result['created']
+                errors = result['errors']
+                for path in created:
+                    record(parse_memory_filename(Path(path).name), 'created', path)
+                for err_date, err_msg in errors:
+                    record(err_date, 'error')
+                    click.echo(f"Error for {err_date}: {err_msg}")
+            elif all_gaps:
+                click.echo(f"Summarizing {len(all_gaps)} days "
+                           f"({min(get_llm_concurrency(), len(all_gaps))} concurrent)...")
+
+                def summarize_gap(gap_date):
+                    output_path = memory_path / f"{gap_date}.md"
+                    return generate_fn(gap_date, sessions_path, output_path, force=True, preserve=preserve)
+
+                for gap_date, future in iter_concurrent([gap.date for gap in all_gaps], summarize_gap):
                     try:
-                        path = generate_fn(gap.date, sessions_path, output_path, force=True, preserve=preserve)
+                        path = future.result()
                         created.append(path)
-                        click.echo(" done")
-                        # Rate limiting: delay between LLM calls to avoid hitting API limits
-                        if i < len(all_gaps) - 1:  # Don't delay after the last one
-                            time.sleep(LLM_BATCH_DELAY_SECONDS)
+                        record(gap_date, 'created', path)
+                        click.echo(f"Summarized {gap_date}")
                     except Exception as e:
-                        errors.append((gap.date, str(e)))
-                        click.echo(f" error: {e}")
+                        errors.append((gap_date, str(e)))
+                        record(gap_date, 'error')
+                        click.echo(f"Error for {gap_date}: {e}")
 
+            if not dry_run:
                 if created:
                     click.echo(f"\nCreated {len(created)} files")
                 if errors:
@@ -2294,7 +4023,10 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
                 if not created and not errors:
                     click.echo("No missing files to backfill.")
         else:
-            result = backfill_all_missing(sessions_path, memory_path, dry_run=dry_run, force=force, preserve=preserve)
+            result = backfill_all_missing(
+                sessions_path, memory_path, dry_run=dry_run, force=force, preserve=preserve,
+                skip_dates=done_dates, on_result=record
+            )
 
             if dry_run:
                 click.echo("Dry run - no files created")
@@ -2302,9 +4034,11 @@ def backfill(target_date, backfill_all, today, since_date, until_date, increment
 
             if result['created']:
                 action = "Would create" if dry_run else "Created"
-                click.echo(f"{action} {len(result['created'])} files:")
+                out = BufferedEcho()
+                out(f"{action} {len(result['created'])} files:")
                 for path in result['created']:
-                    click.echo(f"  {path}")
+                    out(f"  {path}")
+                out.flush()
 
             if result['skipped']:
                 click.echo(f"\nSkipped {len(result['skipped'])} existing files (use --force to overwrite)")
@@ -2334,58 +4068,65 @@ def extract(target_date, query, model, output_format, sessions_dir):
 
     date_filter = parse_date_str(target_date) if target_date else None
 
-    messages = []
-    for session_file in find_session_files(sessions_path):
-        for msg in get_messages(session_file, date_filter=date_filter):
-            if query and query.lower() not in msg.text_content.lower():
-                continue
-
-            if model and msg.model != model:
-                continue
-
-            messages.append(msg)
+    if date_filter:
+        session_files = find_session_files_for_date(sessions_path, date_filter)
+    else:
+        session_files = find_session_files(sessions_path)
 
-    messages.sort(key=lambda m: m.timestamp)
+    # Large scans are CPU-bound (JSON decode + sanitize), so spread files over
+    # processes; small ones stay in-process, where output starts immediately.
+    # Either way session logs are append-only, so each file yields in timestamp
+    # order and a lazy merge gives the same global order.
+    if parse_workers(session_files) > 1:
+        per_file = map_session_files(collect_extract_matches, session_files, date_filter, model, query)
+    else:
+        per_file = (iter_extract_matches(f, date_filter, model, query) for f in session_files)
 
-    if not messages:
-        click.echo("No matching messages found.")
-        return
+    messages = heapq.merge(*per_file, key=attrgetter('timestamp'))
 
-    click.echo(f"Found {len(messages)} matching messages")
-    click.echo("")
+    out = BufferedEcho()
+    count = 0
 
     if output_format == 'json':
-        data = [
-            {
+        # Same text as dumps_json_pretty(list), framed by hand one item at a time
+        for m in messages:
+            item = dumps_json_pretty({
                 'id': m.id,
                 'timestamp': m.timestamp.isoformat(),
                 'role': m.role,
-                'text': sanitize_content(m.text_content),
+                'text': m.text_content,
                 'model': m.model,
                 'provider': m.provider,
-            }
-            for m in messages
-        ]
-        click.echo(json.dumps(data, indent=2))
+            })
+            out(('[\n  ' if count == 0 else ',\n  ') + item.replace('\n', '\n  '), nl=False)
+            count += 1
+        if count:
+            out('\n]')
 
     elif output_format == 'text':
         for msg in messages:
-            time_str = msg.timestamp.strftime('%Y-%m-%d %H:%M')
+            # Format from fields directly; strftime dominated this loop
+            t = msg.timestamp
+            time_str = f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}"
             role = msg.role.upper()
-            text = sanitize_content(msg.text_content)
-            click.echo(f"[{time_str}] {role}: {text}")
-            click.echo("")
+            out(f"[{time_str}] {role}: {msg.text_content}\n")
+            count += 1
 
     else:  # md
         for msg in messages:
-            time_str = msg.timestamp.strftime('%Y-%m-%d %H:%M')
+            t = msg.timestamp
+            time_str = f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}"
             role = msg.role.capitalize()
             model_str = f" ({msg.model})" if msg.model else ""
-            click.echo(f"### [{time_str}] {role}{model_str}")
-            click.echo("")
-            text = sanitize_content(msg.text_content)
-            click.echo(text)
-            click.echo("")
+            out(f"### [{time_str}] {role}{model_str}\n\n{msg.text_content}\n")
+            count += 1
+
+    if not count:
+        out("No matching messages found.")
+    out.flush()
+    if count:
+        # Reported last since output is streamed; on stderr for json so stdout stays parseable
+        click.echo(f"Found {count} matching messages", err=output_format == 'json')
 
 
 @main.command()
@@ -2395,9 +4136,10 @@ def extract(target_date, query, model, output_format, sessions_dir):
               default='anthropic',
               help="Backend for LLM summarization (default: anthropic - uses Claude models)")
 @click.option("--model", default=None, help="Model override for summarization (default varies by backend)")
+@click.option("--no-cache", "no_cache", is_flag=True, help="Always call the LLM, bypassing the on-disk summary cache")
 @click.option("--output", default=None, help="Write to file (default: stdout)")
 @click.option("--sessions-dir", default=None, help="Path to session logs directory")
-def summarize(target_date, summarize_backend, model, output, sessions_dir):
+def summarize(target_date, summarize_backend, model, no_cache, output, sessions_dir):
     """Generate an LLM summary for a single day."""
     sessions_path = Path(sessions_dir) if sessions_dir else get_default_sessions_dir()
 
@@ -2406,27 +4148,23 @@ def summarize(target_date, summarize_backend, model, output, sessions_dir):
         sys.exit(1)
 
     log_date = parse_date_str(target_date)
-
-    # Track whether we're using a temp file for cleanup
-    using_temp_file = output is None
-    if output:
-        output_path = Path(output)
-    else:
-        tmp = tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False)
-        output_path = Path(tmp.name)
-        tmp.close()
+    cache_dir = None if no_cache else get_default_llm_cache_dir()
 
     try:
-        generate_summarized_memory(
-            log_date, sessions_path, output_path,
-            force=True, model=model, backend=summarize_backend
-        )
-
-        if using_temp_file:
-            content = output_path.read_text()
-            click.echo(content)
-        else:
+        if output:
+            output_path = Path(output)
+            generate_summarized_memory(
+                log_date, sessions_path, output_path,
+                force=True, model=model, backend=summarize_backend, cache_dir=cache_dir
+            )
             click.echo(f"Wrote summary to: {output_path}")
+        else:
+            # stdout: render in memory, no temp file round-trip
+            content = render_summarized_memory(
+                log_date, sessions_path,
+                model=model, backend=summarize_backend, cache_dir=cache_dir
+            )
+            click.echo(content)
 
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
@@ -2434,10 +4172,6 @@ def summarize(target_date, summarize_backend, model, output, sessions_dir):
     except Exception as e:
         click.echo(f"Error generating summary: {e}", err=True)
         sys.exit(1)
-    finally:
-        # Clean up temp file regardless of success or failure
-        if using_temp_file and output_path.exists():
-            output_path.unlink()
 
 
 @main.command()
@@ -2496,77 +4230,98 @@ def stats(sessions_dir, memory_dir):
     """Show coverage statistics."""
     sessions_path = Path(sessions_dir) if sessions_dir else get_default_sessions_dir()
     memory_path = Path(memory_dir) if memory_dir else get_default_memory_dir()
+    out = BufferedEcho()
 
-    click.echo("Memory Sync Statistics")
-    click.echo("=" * 50)
-    click.echo("")
+    out("Memory Sync Statistics")
+    out("=" * 50)
+    out("")
 
-    click.echo("Session Logs")
-    click.echo("-" * 30)
+    out("Session Logs")
+    out("-" * 30)
 
-    if sessions_path.exists():
-        session_files = find_session_files(sessions_path)
-        click.echo(f"  Session files: {len(session_files)}")
+    # One directory listing + stat pass, shared by every section below
+    session_metas = scan_session_files(sessions_path)
+    session_files = [m.path for m in session_metas]
+    # Parsed once in the session section and reused for coverage
+    daily_activity = None
+    date_range = (None, None)
+
+    if not sessions_path.exists():
+        out(f"  Directory not found: {sessions_path}")
 
-        total_size = sum(f.stat().st_size for f in session_files)
-        click.echo(f"  Total size: {total_size / 1024 / 1024:.1f} MB")
+    elif not session_files:
+        # Nothing to parse; skip the date/activity/transition passes entirely
+        out("  Session files: 0")
 
-        first_date, last_date = get_date_range(sessions_path)
-        if first_date and last_date:
-            click.echo(f"  Date range: {first_date} to {last_date}")
+    else:
+        out(f"  Session files: {len(session_files)}")
+
+        total_size = sum(m.size for m in session_metas)
+        out(f"  Total size: {total_size / 1024 / 1024:.1f} MB")
 
-        daily_activity = collect_daily_activity(sessions_path)
-        total_messages = sum(d.message_count for d in daily_activity.values())
-        total_user = sum(d.user_messages for d in daily_activity.values())
-        total_assistant = sum(d.assistant_messages for d in daily_activity.values())
-        total_tool = sum(d.tool_result_messages for d in daily_activity.values())
+        date_range = get_date_range(sessions_path, session_files)
+        first_date, last_date = date_range
+        if first_date and last_date:
+            out(f"  Date range: {first_date} to {last_date}")
 
-        click.echo(f"  Total messages: {total_messages}")
-        click.echo(f"    User: {total_user}")
-        click.echo(f"    Assistant: {total_assistant}")
-        click.echo(f"    Tool results: {total_tool}")
+        daily_activity = collect_daily_activity(sessions_path, session_files)
 
+        # All totals in one pass over the days
+        total_messages = total_user = total_assistant = total_tool = 0
         all_models: set[str] = set()
         for activity in daily_activity.values():
+            total_messages += activity.message_count
+            total_user += activity.user_messages
+            total_assistant += activity.assistant_messages
+            total_tool += activity.tool_result_messages
             all_models.update(activity.models_used)
+
+        out(f"  Total messages: {total_messages}")
+        out(f"    User: {total_user}")
+        out(f"    Assistant: {total_assistant}")
+        out(f"    Tool results: {total_tool}")
+
         if all_models:
-            click.echo(f"  Models used: {', '.join(sorted(all_models))}")
+            out(f"  Models used: {', '.join(sorted(all_models))}")
 
-        trans_list = list(extract_transitions(sessions_path))
+        trans_list = list(extract_transitions(sessions_path, session_files=session_files))
         trans_stats = get_transition_stats(trans_list)
-        click.echo(f"  Model transitions: {trans_stats['total_transitions']}")
-
-    else:
-        click.echo(f"  Directory not found: {sessions_path}")
+        out(f"  Model transitions: {trans_stats['total_transitions']}")
 
-    click.echo("")
+    out("")
 
-    click.echo("Memory Files")
-    click.echo("-" * 30)
+    out("Memory Files")
+    out("-" * 30)
 
     if memory_path.exists():
-        memory_files = get_memory_files(memory_path)
-        click.echo(f"  Daily files: {len(memory_files)}")
+        # Sizes are captured once here and reused by find_gaps below
+        memory_files = scan_memory_files(memory_path)
+        out(f"  Daily files: {len(memory_files)}")
 
-        total_size = sum(f.stat().st_size for _, f in memory_files)
-        click.echo(f"  Total size: {total_size / 1024:.1f} KB")
+        total_size = sum(m.size for m in memory_files)
+        out(f"  Total size: {total_size / 1024:.1f} KB")
 
         if memory_files:
-            first_mem = memory_files[0][0]
-            last_mem = memory_files[-1][0]
-            click.echo(f"  Date range: {first_mem} to {last_mem}")
-
-        if sessions_path.exists():
-            gaps = find_gaps(sessions_path, memory_path, exclude_today=True)
-            click.echo(f"  Coverage: {gaps['coverage_pct']:.1f}%")
-            click.echo(f"    Active days: {gaps['total_active_days']}")
-            click.echo(f"    Covered days: {gaps.get('covered_days', 0)}")
-            click.echo(f"    Missing: {len(gaps['missing_days'])}")
-            click.echo(f"    Sparse: {len(gaps['sparse_days'])}")
+            first_mem = memory_files[0].date
+            last_mem = memory_files[-1].date
+            out(f"  Date range: {first_mem} to {last_mem}")
+
+        if session_files:
+            gaps = find_gaps(
+                sessions_path, memory_path, exclude_today=True,
+                session_files=session_files, memory_files=memory_files,
+                daily_activity=daily_activity, date_range=date_range
+            )
+            out(f"  Coverage: {gaps['coverage_pct']:.1f}%")
+            out(f"    Active days: {gaps['total_active_days']}")
+            out(f"    Covered days: {gaps.get('covered_days', 0)}")
+            out(f"    Missing: {len(gaps['missing_days'])}")
+            out(f"    Sparse: {len(gaps['sparse_days'])}")
     else:
-        click.echo(f"  Directory not found: {memory_path}")
+        out(f"  Directory not found: {memory_path}")
 
-    click.echo("")
+    out("")
+    out.flush()
 
 
 if __name__ == "__main__":
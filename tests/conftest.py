@@ -95,3 +95,10 @@ def temp_state_dir(tmp_path, monkeypatch):
     monkeypatch.setattr(Path, 'home', lambda: tmp_path)
     
     return state_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_session_manifests(tmp_path, monkeypatch):
+    """Write session manifests under tmp_path, never the real workspace or cache."""
+    monkeypatch.setattr('memory_sync.SESSION_INDEX_DIR', tmp_path / 'sessionindex')
+    monkeypatch.setattr('memory_sync.SESSION_CACHE_DIR', tmp_path / 'sessioncache')